@@ -1,11 +1,12 @@
 __version__ = "0.7.2"
-from .backtest import Backtester, BacktestResult, CloseData
+from .backtest import Backtester, BacktestResult, CloseData, CloseDataTuple
 from .order import LimitOrder, MarketOrder, OrderBase, _IndexType, _OrderType
 
 __all__ = [
     "Backtester",
     "BacktestResult",
     "CloseData",
+    "CloseDataTuple",
     "OrderBase",
     "LimitOrder",
     "MarketOrder",
@@ -1,4 +1,4 @@
 from .backtest import Backtester
-from .dtypes import BacktestResult, CloseData
+from .dtypes import BacktestResult, CloseData, CloseDataTuple
 
-__all__ = ["Backtester", "BacktestResult", "CloseData"]
+__all__ = ["Backtester", "BacktestResult", "CloseData", "CloseDataTuple"]
@@ -1,25 +1,301 @@
 from __future__ import annotations
 
+import copy
+import itertools
 import warnings
 from abc import ABCMeta, abstractmethod
-from functools import reduce
 from logging import getLogger
-from typing import Any, Generic, Iterable, final
+from typing import Any, Callable, Generic, Iterable, Mapping, Sequence, final
 
 import attrs
 import joblib
 import numpy as np
 from exceptiongroup import ExceptionGroup
-from pandas import DataFrame, Series
+from numpy.typing import DTypeLike, NDArray
+from pandas import DataFrame, Series, concat
 from tqdm import tqdm
 
-from backtrade.logic import FinishedOrder, ProcessOrderArgs, process_order
+from backtrade.finished_order import FinishedOrder, FinishedOrderState
+from backtrade.logic import (
+    process_limit_order_scalar,
+    process_market_order_scalar,
+    process_orders_vectorized,
+)
 
 from ..order import LimitOrder, MarketOrder, _IndexType
-from .dtypes import BacktestResult, CloseData
+from ..validator import _na_validator_batch
+from .dtypes import BacktestResult, CloseData, CloseDataTuple
 
 __all__ = ["Backtester"]
 
+_PBAR_UPDATE_INTERVAL = 4096
+_OHLC_COLUMNS = ("open", "close", "high", "low")
+_OHLC_COLUMNS_CAPITALIZED = ("Open", "Close", "High", "Low")
+_OHLC_COLUMNS_SET = frozenset(_OHLC_COLUMNS)
+_OHLC_COLUMNS_CAPITALIZED_SET = frozenset(_OHLC_COLUMNS_CAPITALIZED)
+
+
+@attrs.frozen
+class _OpenOrders:
+    """Orders waiting to be settled on the next bar, stored column-wise
+    so that settling them does not go through the attributes of each order."""
+
+    orders: tuple[LimitOrder | MarketOrder, ...] = ()
+    sizes: tuple[float, ...] = ()
+    prices: tuple[float, ...] = ()
+    post_only: tuple[bool, ...] = ()
+    is_market: tuple[bool, ...] = ()
+
+    @classmethod
+    def from_orders(cls, orders: Iterable[LimitOrder | MarketOrder]) -> _OpenOrders:
+        """Convert the orders placed on the close to columns.
+
+        Orders with size 0 are dropped and the price of market orders is NaN."""
+        orders_ = tuple(order for order in orders if order.size != 0.0)
+        if not orders_:
+            return _NO_OPEN_ORDERS
+        is_market = tuple(not isinstance(order, LimitOrder) for order in orders_)
+        return cls(
+            orders=orders_,
+            sizes=tuple(order.size for order in orders_),
+            prices=tuple(
+                np.nan if is_market_ else order.price  # type: ignore
+                for order, is_market_ in zip(orders_, is_market)
+            ),
+            post_only=tuple(
+                not is_market_ and order.post_only  # type: ignore
+                for order, is_market_ in zip(orders_, is_market)
+            ),
+            is_market=is_market,
+        )
+
+
+_NO_OPEN_ORDERS = _OpenOrders()
+
+
+def _settle_orders(
+    open_orders: _OpenOrders,
+    *,
+    last_close: float | None,
+    high: float,
+    low: float,
+    maker_fee: float,
+    taker_fee: float,
+    index: _IndexType,
+) -> tuple[float, float, list[FinishedOrder[_IndexType, Any]]]:
+    """Settle the orders placed on the previous close against the current bar.
+
+    Returns
+    -------
+    tuple[float, float, list[FinishedOrder]]
+        Total balance decrement, total position increment and the finished orders.
+    """
+    balance_decrement = 0.0
+    position_increment = 0.0
+    finished_orders: list[FinishedOrder[_IndexType, Any]] = []
+    for order, size, price, post_only, is_market in zip(
+        open_orders.orders,
+        open_orders.sizes,
+        open_orders.prices,
+        open_orders.post_only,
+        open_orders.is_market,
+    ):
+        assert last_close is not None  # nosec
+        (order_balance_decrement, executed_price, quote_size, fee, state,) = (
+            process_market_order_scalar(size, last_close, taker_fee)
+            if is_market
+            else process_limit_order_scalar(
+                size, price, post_only, last_close, high, low, maker_fee, taker_fee
+            )
+        )
+        balance_decrement += order_balance_decrement
+        if executed_price is not None:
+            position_increment += size
+        finished_orders.append(
+            FinishedOrder(
+                index=index,
+                order=order,
+                balance_decrement=order_balance_decrement,
+                executed_price=executed_price,
+                quote_size=quote_size,
+                fee=fee,
+                state=state,
+            )
+        )
+    return balance_decrement, position_increment, finished_orders
+
+
+def _as_c(series: Series[Any], dtype: DTypeLike = np.float64) -> NDArray[Any]:
+    """Get the values of a column as a C-contiguous array.
+
+    Columns of a DataFrame may be strided views depending on how
+    the frame was built, this makes sure they are scanned with unit stride."""
+    return np.ascontiguousarray(series.to_numpy(), dtype=dtype)
+
+
+class _LazyRow:
+    """Row of a DataFrame that is only built as a Series when used as one.
+
+    Looking up a single column reads it from the arrays of the columns,
+    any other attribute, lookup or operator is forwarded to the Series of the row."""
+
+    __slots__ = ("_df", "_columns", "_i", "_series")
+
+    def __init__(self, df: DataFrame, columns: dict[Any, NDArray[Any]], i: int) -> None:
+        self._df = df
+        self._columns = columns
+        self._i = i
+        self._series: Series[Any] | None = None
+
+    @property
+    def series(self) -> Series[Any]:
+        """The row as a Series, built on first use."""
+        if self._series is None:
+            self._series = self._df.iloc[self._i]
+        return self._series
+
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            return self._columns[key][self._i]
+        except (KeyError, TypeError):
+            return self.series[key]
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.series, name)
+
+    # Series are unhashable
+    __hash__ = None  # type: ignore
+
+
+# Special methods are looked up on the type, so __getattr__ does not forward them
+_LAZY_ROW_FORWARDED = (
+    "__contains__",
+    "__len__",
+    "__iter__",
+    "__array__",
+    "__bool__",
+    "__repr__",
+    "__str__",
+    "__eq__",
+    "__ne__",
+    "__lt__",
+    "__le__",
+    "__gt__",
+    "__ge__",
+    "__neg__",
+    "__pos__",
+    "__abs__",
+    "__invert__",
+    "__add__",
+    "__radd__",
+    "__sub__",
+    "__rsub__",
+    "__mul__",
+    "__rmul__",
+    "__truediv__",
+    "__rtruediv__",
+    "__floordiv__",
+    "__rfloordiv__",
+    "__mod__",
+    "__rmod__",
+    "__pow__",
+    "__rpow__",
+    "__and__",
+    "__rand__",
+    "__or__",
+    "__ror__",
+    "__xor__",
+    "__rxor__",
+)
+
+
+def _forward_to_series(name: str) -> Callable[..., Any]:
+    def method(self: _LazyRow, *args: Any, **kwargs: Any) -> Any:
+        return getattr(self.series, name)(*args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+for _name in _LAZY_ROW_FORWARDED:
+    setattr(_LazyRow, _name, _forward_to_series(_name))
+
+
+def _check_arguments(
+    df: DataFrame, *, balance_init: float, taker_fee: float
+) -> DataFrame:
+    """Check the arguments passed to the backtester.
+
+    Returns
+    -------
+    DataFrame
+        df with lowercase "open", "close", "high", "low" columns.
+
+    Raises
+    ------
+    ExceptionGroup
+        If any of the arguments are invalid.
+    """
+    # Errors
+    errors: list[ValueError] = []
+    columns = set(df.columns)
+    if not _OHLC_COLUMNS_SET.issubset(columns):
+        if _OHLC_COLUMNS_CAPITALIZED_SET.issubset(columns):
+            df = df.copy()
+            df[list(_OHLC_COLUMNS)] = df[list(_OHLC_COLUMNS_CAPITALIZED)]
+        else:
+            errors.append(
+                ValueError(
+                    'df must have columns "open", "close", "high", "low", '
+                    + f"but got {df.columns}"
+                )
+            )
+    if not errors:
+        open_, close, high, low = (df[col].to_numpy() for col in _OHLC_COLUMNS)
+        # Check everything in one pass and only look for
+        # the precise reasons if something is wrong
+        if (
+            (np.maximum(open_, close) > high)
+            | (np.minimum(open_, close) < low)
+            | (high < low)
+            | (low <= 0)
+        ).any():
+            if (open_ > high).any():
+                errors.append(ValueError("open price must be less than high price"))
+            if (open_ < low).any():
+                errors.append(ValueError("open price must be greater than low price"))
+            if (close > high).any():
+                errors.append(ValueError("close price must be less than high price"))
+            if (close < low).any():
+                errors.append(ValueError("close price must be greater than low price"))
+            if (high < low).any():
+                errors.append(ValueError("high price must be greater than low price"))
+            if (open_ <= 0).any():
+                errors.append(ValueError("open price must be greater than 0"))
+            if (close <= 0).any():
+                errors.append(ValueError("close price must be greater than 0"))
+            if (high <= 0).any():
+                errors.append(ValueError("high price must be greater than 0"))
+            if (low <= 0).any():
+                errors.append(ValueError("low price must be greater than 0"))
+    if not df.index.is_monotonic_increasing:
+        errors.append(ValueError("index must be monotonic increasing"))
+    if not df.index.is_unique:
+        errors.append(ValueError("index must be unique"))
+    if not balance_init > 0:
+        errors.append(ValueError("balance_init must be greater than 0"))
+
+    # Warnings
+    if not taker_fee > 0:
+        warnings.warn(f"taker_fee is not positive (got {taker_fee}), are you sure?")
+
+    # Raise errors
+    if errors:
+        raise ExceptionGroup(
+            "Invalid arguments" + str([e.args[0] for e in errors]), errors
+        )
+    return df
+
 
 class Backtester(Generic[_IndexType], metaclass=ABCMeta):
     """Simple backtester.
@@ -65,6 +341,8 @@ class Backtester(Generic[_IndexType], metaclass=ABCMeta):
         name: str | None = None,
         n_splits: int = -1,
         logarithmic: bool = True,
+        fast_close_data: bool = False,
+        lazy_row: bool = False,
     ) -> BacktestResult[_IndexType]:
         if n_splits == 0:
             raise ValueError("n_splits must be not 0")
@@ -76,17 +354,22 @@ class Backtester(Generic[_IndexType], metaclass=ABCMeta):
         if n_splits < 0:
             n_splits = joblib.parallel.cpu_count() + n_splits + 1
 
-        df_split = np.array_split(df, n_splits)
-        maker_fee_split = np.full(n_splits, maker_fee)
-        taker_fee_split = np.full(n_splits, taker_fee)
-        balance_init_split = np.full(n_splits, balance_init)
-        name_split = np.full(n_splits, name)
-        logarithmic_split = np.full(n_splits, logarithmic)
+        # Split by position, which slices the frame instead of
+        # letting np.array_split copy it through swapaxes
+        sizes = np.full(n_splits, len(df) // n_splits)
+        sizes[: len(df) % n_splits] += 1
+        bounds = np.concatenate(([0], np.cumsum(sizes))).tolist()
         results: list[BacktestResult[_IndexType]] | None = joblib.Parallel(
-            n_jobs=-1, verbose=10
+            # Each task is a whole split, so do not batch them.
+            # Large arrays are memory-mapped (copy-on-write) instead of pickled.
+            n_jobs=-1,
+            backend="loky",
+            batch_size=1,
+            mmap_mode="c",
+            verbose=10,
         )(
             joblib.delayed(self)(
-                df,
+                df.iloc[start:stop],
                 maker_fee=maker_fee,
                 taker_fee=taker_fee,
                 balance_init=balance_init,
@@ -94,33 +377,58 @@ class Backtester(Generic[_IndexType], metaclass=ABCMeta):
                 logarithmic=logarithmic,
                 name=name,
                 use_tqdm=False,
+                # each worker receives its own pickled slice
+                copy=False,
+                fast_close_data=fast_close_data,
+                lazy_row=lazy_row,
             )
-            for df, maker_fee, taker_fee, balance_init, logarithmic, name in zip(
-                df_split,
-                maker_fee_split,
-                taker_fee_split,
-                balance_init_split,
-                logarithmic_split,
-                name_split,
-            )
+            for start, stop in zip(bounds[:-1], bounds[1:])
         )
         if results is None:
             raise ValueError("Joblib returned None.")
 
+        # Stitch the splits so that each one starts where the previous one ended
         if logarithmic:
-            result = reduce(
-                lambda x, y: x + y * (x.equity_quote[-1] / y.equity_quote[0]), results
-            )
-            result = attrs.evolve(result, name=name)
+            scales = [1.0]
+            for previous, current in zip(results, results[1:]):
+                scales.append(
+                    scales[-1]
+                    * previous.equity_quote.iat[-1]
+                    / current.equity_quote.iat[0]
+                )
+            results = [result * scale for result, scale in zip(results, scales)]
+            offsets = [0.0] * n_splits
         else:
-            result = reduce(lambda x, y: x + y, results)
-            result = attrs.evolve(
-                result,
-                name=name,
-                equity_quote=result.equity_quote - balance_init * (n_splits - 1),
-                balance_quote=result.balance_quote - balance_init * (n_splits - 1),
-            )
-        return result
+            offsets = [0.0]
+            for previous, current in zip(results, results[1:]):
+                offsets.append(
+                    offsets[-1]
+                    + previous.equity_quote.iat[-1]
+                    - current.equity_quote.iat[0]
+                )
+
+        return BacktestResult(
+            name=name,
+            close=concat([result.close for result in results]),
+            position=concat([result.position for result in results]),
+            position_quote=concat([result.position_quote for result in results]),
+            balance_quote=concat(
+                [
+                    result.balance_quote + offset
+                    for result, offset in zip(results, offsets)
+                ]
+            ),
+            equity_quote=concat(
+                [
+                    result.equity_quote + offset
+                    for result, offset in zip(results, offsets)
+                ]
+            ),
+            finished_orders=concat([result.finished_orders for result in results]),
+            maker_fee_rate=maker_fee,
+            taker_fee_rate=taker_fee,
+            logarithmic=logarithmic,
+        )
 
     @final
     def __call__(
@@ -134,6 +442,10 @@ class Backtester(Generic[_IndexType], metaclass=ABCMeta):
         n_splits: int = 1,
         logarithmic: bool = True,
         use_tqdm: bool = True,
+        copy: bool = True,
+        fast_close_data: bool = False,
+        lazy_row: bool = False,
+        vectorized: bool = False,
     ) -> BacktestResult[_IndexType]:
         """Initialize the backtester.
 
@@ -150,73 +462,66 @@ class Backtester(Generic[_IndexType], metaclass=ABCMeta):
             Initial balance, by default 1
         name : str, optional
             Name of the backtest, by default None
+        n_splits : int, optional
+            Number of chunks of df run in parallel, by default 1.
+            Positions are not carried over between chunks,
+            so the stitched result is only an approximation.
+            Use `sweep` to run independent backtests in parallel.
+        logarithmic : bool, optional
+            Whether the results are logarithmic, by default True
+        use_tqdm : bool, optional
+            Whether to show a progress bar, by default True
+        copy : bool, optional
+            Whether to copy `df` before running, by default True.
+            `df` is only read from, so False saves a copy of the whole frame
+            when the caller does not modify it while `on_close` runs.
+        fast_close_data : bool, optional
+            Whether to pass `CloseDataTuple` instead of `CloseData`
+            to `on_close`, by default False. It has the same fields
+            but is much cheaper to construct on every bar.
+        lazy_row : bool, optional
+            Whether to pass a lazy row to `on_close` instead of a Series,
+            by default False. `row[column]` reads the value without building
+            a Series and `df` is not converted to a single array up front,
+            other uses of the row build the Series of that bar on demand.
+        vectorized : bool, optional
+            Whether to run `vectorized_call` with `on_close_vectorized`
+            instead of calling `on_close` on every bar, by default False.
+            `n_splits`, `use_tqdm`, `copy`, `fast_close_data` and `lazy_row`
+            only apply to the loop over bars and are ignored.
         """
-
-        # Check arguments
-        # Errors
-        errors: list[ValueError] = []
-        if not all(col in df.columns for col in ["open", "close", "high", "low"]):
-            if all(col in df.columns for col in ["Open", "Close", "High", "Low"]):
-                df = df.copy()
-                df[["open", "close", "high", "low"]] = df[
-                    ["Open", "Close", "High", "Low"]
-                ]
-            else:
-                errors.append(
-                    ValueError(
-                        'df must have columns "open", "close", "high", "low", '
-                        + f"but got {df.columns}"
-                    )
-                )
-        if not errors:
-            if (df["open"] > df["high"]).any():
-                errors.append(ValueError("open price must be less than high price"))
-            if (df["open"] < df["low"]).any():
-                errors.append(ValueError("open price must be greater than low price"))
-            if (df["close"] > df["high"]).any():
-                errors.append(ValueError("close price must be less than high price"))
-            if (df["close"] < df["low"]).any():
-                errors.append(ValueError("close price must be greater than low price"))
-            if (df["high"] < df["low"]).any():
-                errors.append(ValueError("high price must be greater than low price"))
-            if (df["open"] <= 0).any():
-                errors.append(ValueError("open price must be greater than 0"))
-            if (df["close"] <= 0).any():
-                errors.append(ValueError("close price must be greater than 0"))
-            if (df["high"] <= 0).any():
-                errors.append(ValueError("high price must be greater than 0"))
-            if (df["low"] <= 0).any():
-                errors.append(ValueError("low price must be greater than 0"))
-        if not df.index.is_monotonic_increasing:
-            errors.append(ValueError("index must be monotonic increasing"))
-        if not df.index.is_unique:
-            errors.append(ValueError("index must be unique"))
-        if not balance_init > 0:
-            errors.append(ValueError("balance_init must be greater than 0"))
-
-        # Warnings
-        if not taker_fee > 0:
-            warnings.warn(f"taker_fee is not positive (got {taker_fee}), are you sure?")
-
-        # Raise errors
-        if errors:
-            raise ExceptionGroup(
-                "Invalid arguments" + str([e.args[0] for e in errors]), errors
+        if vectorized:
+            return self.vectorized_call(
+                df,
+                maker_fee=maker_fee,
+                taker_fee=taker_fee,
+                balance_init=balance_init,
+                name=name,
+                logarithmic=logarithmic,
             )
 
-        # Multiprocessing
+        df_checked = _check_arguments(
+            df, balance_init=balance_init, taker_fee=taker_fee
+        )
+
+        # Multiprocessing, each worker receives its own pickled slice
+        # so df is not copied here
         if n_splits != 1:
             return self._parrarel(
-                df,
+                df_checked,
                 maker_fee=maker_fee,
                 taker_fee=taker_fee,
                 balance_init=balance_init,
                 name=name,
                 n_splits=n_splits,
                 logarithmic=logarithmic,
+                fast_close_data=fast_close_data,
+                lazy_row=lazy_row,
             )
 
-        df = df.copy()
+        # _check_arguments already copies df when renaming the columns
+        df = df_checked.copy() if copy and df_checked is df else df_checked
+
         # logger
         self.logger = getLogger(__name__)
 
@@ -224,26 +529,53 @@ class Backtester(Generic[_IndexType], metaclass=ABCMeta):
         self.init()
 
         # Calculate
-        open_orders: tuple[LimitOrder | MarketOrder, ...] = ()
+        open_orders = _NO_OPEN_ORDERS
         last_close: float | None = None
         position = 0.0
         balance = balance_init
 
-        position_history: Series[float] = Series(np.nan, index=df.index)
-        position_quote_history: Series[float] = Series(np.nan, index=df.index)
-        balance_quote_history: Series[float] = Series(np.nan, index=df.index)
-        equity_quote_history: Series[float] = Series(np.nan, index=df.index)
-        finished_orders_history: Series[list[FinishedOrder[_IndexType, Any]]] = Series(
-            np.nan, index=df.index, dtype=object
-        )
-
-        pbar = tqdm(df.iterrows(), total=len(df), disable=not use_tqdm)
-        for index, row in pbar:
-            index: _IndexType  # type: ignore
-            row: Series[float]  # type: ignore
-            open_ = row["open"]
-            high = row["high"]
-            low = row["low"]
+        # Extract columns once (struct of arrays) instead of
+        # looking up each column on a Series per row
+        n = len(df)
+        index_list: list[_IndexType] = df.index.tolist()
+        open_list: list[float] = _as_c(df["open"]).tolist()
+        high_list: list[float] = _as_c(df["high"]).tolist()
+        low_list: list[float] = _as_c(df["low"]).tolist()
+        close_list: list[float] = _as_c(df["close"]).tolist()
+        columns = df.columns
+        if lazy_row:
+            # Arrays of the columns are views for most frames,
+            # duplicated labels are left to the Series of the row
+            column_arrays = {
+                column: df[column].to_numpy()
+                for column in columns[~columns.duplicated(keep=False)]
+            }
+        else:
+            values = df.to_numpy()
+
+        # Preallocate histories and write them by position,
+        # the Series are built once after the loop.
+        # Labels of df.index (Timestamp, tuples of a MultiIndex, ...) are only
+        # passed through and never hashed or looked up while iterating
+        position_history = np.empty(n, dtype=np.float64)
+        position_quote_history = np.empty(n, dtype=np.float64)
+        balance_quote_history = np.empty(n, dtype=np.float64)
+        equity_quote_history = np.empty(n, dtype=np.float64)
+        # Finished orders of all bars, flattened, with the position of their bar
+        finished_orders_flat: list[FinishedOrder[_IndexType, Any]] = []
+        finished_orders_positions: list[int] = []
+
+        close_data_cls = CloseDataTuple if fast_close_data else CloseData
+
+        # Updating the progress bar on every bar costs more than
+        # a light on_close, so it is advanced in batches
+        pbar = tqdm(total=n, disable=not use_tqdm, mininterval=0.5)
+        for i in range(n):
+            index = index_list[i]
+            open_ = open_list[i]
+            high = high_list[i]
+            low = low_list[i]
+            close = close_list[i]
 
             # Assert
             # assert open_ >= low
@@ -252,39 +584,42 @@ class Backtester(Generic[_IndexType], metaclass=ABCMeta):
             # assert open_ > 0
             # assert high > 0
 
-            # Iterate each open orders
-            finished_orders: list[FinishedOrder[_IndexType, Any]] = []
-            for order in open_orders:
-                assert last_close is not None  # nosec
-                if order.size == 0.0:
-                    continue
-                finished_order = process_order(
-                    ProcessOrderArgs(
-                        order=order,
-                        last_close=last_close,
-                        high=high,
-                        low=low,
-                        maker_fee=maker_fee,
-                        taker_fee=taker_fee,
-                        index=index,
-                    )
+            # Iterate each open orders, most bars have none
+            if open_orders.orders:
+                (
+                    balance_decrement,
+                    position_increment,
+                    finished_orders,
+                ) = _settle_orders(
+                    open_orders,
+                    last_close=last_close,
+                    high=high,
+                    low=low,
+                    maker_fee=maker_fee,
+                    taker_fee=taker_fee,
+                    index=index,
                 )
-                balance -= finished_order.balance_decrement
-                if finished_order.filled:
-                    position += order.size
-                finished_orders.append(finished_order)
+                balance -= balance_decrement
+                position += position_increment
+                finished_orders_flat.extend(finished_orders)
+                finished_orders_positions.extend([i] * len(finished_orders))
 
             # Call at close
             equity = balance + position * open_
             position_quote = position * open_
-            open_orders = tuple(
+            row: Series[Any] = (
+                _LazyRow(df, column_arrays, i)  # type: ignore
+                if lazy_row
+                else Series(values[i], index=columns, name=index)
+            )
+            open_orders = _OpenOrders.from_orders(
                 self.on_close(
-                    CloseData(
+                    close_data_cls(
                         index=index,
                         open=open_,
                         high=high,
                         low=low,
-                        close=row["close"],
+                        close=close,
                         position=position,
                         position_quote=position_quote,
                         balance_quote=balance,
@@ -293,29 +628,265 @@ class Backtester(Generic[_IndexType], metaclass=ABCMeta):
                     row,
                 )
             )
-            last_close = row["close"]
+            last_close = close
+
+            position_history[i] = position
+            position_quote_history[i] = position_quote
+            balance_quote_history[i] = balance
+            equity_quote_history[i] = equity
+
+            if (i + 1) % _PBAR_UPDATE_INTERVAL == 0:
+                pbar.update(_PBAR_UPDATE_INTERVAL)
+        pbar.update(n % _PBAR_UPDATE_INTERVAL)
+        pbar.close()
+
+        finished_orders_exploded: Series[FinishedOrder[_IndexType, Any]] = Series(
+            finished_orders_flat,
+            index=df.index[finished_orders_positions],
+            dtype=object,
+        )
 
-            position_history[index] = position
-            position_quote_history[index] = position_quote
-            balance_quote_history[index] = balance
-            equity_quote_history[index] = equity
-            finished_orders_history[index] = finished_orders
+        return BacktestResult(
+            name=name,
+            close=df["close"],
+            position=Series(position_history, index=df.index, name="position"),
+            position_quote=Series(
+                position_quote_history, index=df.index, name="position_quote"
+            ),
+            balance_quote=Series(
+                balance_quote_history, index=df.index, name="balance_quote"
+            ),
+            equity_quote=Series(
+                equity_quote_history, index=df.index, name="equity_quote"
+            ),
+            finished_orders=finished_orders_exploded.rename("finished_orders"),
+            maker_fee_rate=maker_fee,
+            taker_fee_rate=taker_fee,
+            logarithmic=logarithmic,
+        )
 
-        finished_orders_exploded = finished_orders_history.explode().dropna()
+    @final
+    def vectorized_call(
+        self,
+        df: DataFrame,
+        *,
+        maker_fee: float,
+        taker_fee: float,
+        balance_init: float = 1,
+        name: str | None = None,
+        logarithmic: bool = True,
+    ) -> BacktestResult[_IndexType]:
+        """Run the backtest with `on_close_vectorized` instead of `on_close`.
+
+        Much faster than `__call__` since there is no loop over rows,
+        but the orders can only depend on `df` (not on the position or balance)
+        and at most one order can be placed per close.
+
+        Parameters
+        ----------
+        df : DataFrame
+            Must have columns 'open', 'close', 'high', 'low'.
+            df will be passed to `on_close_vectorized` method.
+        maker_fee : float
+            Maker fee.
+        taker_fee : float
+            Taker fee.
+        balance_init : float, optional
+            Initial balance, by default 1
+        name : str, optional
+            Name of the backtest, by default None
+        logarithmic : bool, optional
+            Whether the results are logarithmic, by default True
+        """
+        df = _check_arguments(df, balance_init=balance_init, taker_fee=taker_fee)
+
+        # logger
+        self.logger = getLogger(__name__)
+
+        # Initialize
+        self.init()
+
+        # Orders
+        n = len(df)
+        orders = self.on_close_vectorized(df)
+        if len(orders) != n:
+            raise ValueError(
+                f"on_close_vectorized must return {n} rows, but got {len(orders)}"
+            )
+        size = _as_c(orders["size"])
+        # Validated as a column, like the fields of each order in `__call__`
+        _na_validator_batch("size", size)
+        price = (
+            _as_c(orders["price"]) if "price" in orders.columns else np.full(n, np.nan)
+        )
+        post_only = (
+            _as_c(orders["post_only"], np.bool_)
+            if "post_only" in orders.columns
+            else np.zeros(n, dtype=np.bool_)
+        )
+        open_ = _as_c(df["open"])
+        close = _as_c(df["close"])
+
+        # Orders placed on the close of a bar are settled on the next bar
+        (
+            balance_decrement,
+            executed_price,
+            quote_size,
+            fee,
+            state,
+        ) = process_orders_vectorized(
+            size[:-1],
+            price[:-1],
+            post_only[:-1],
+            last_close=close[:-1],
+            high=_as_c(df["high"])[1:],
+            low=_as_c(df["low"])[1:],
+            maker_fee=maker_fee,
+            taker_fee=taker_fee,
+        )
+        filled_size = np.where(np.isnan(executed_price), 0.0, size[:-1])
+        position = np.concatenate(([0.0], np.cumsum(filled_size)))[:n]
+        balance = (
+            balance_init - np.concatenate(([0.0], np.cumsum(balance_decrement)))[:n]
+        )
+        position_quote = position * open_
+        equity = balance + position_quote
+
+        # Finished orders, built only for the orders actually placed
+        active = np.flatnonzero(size[:-1] != 0)
+        settle_index = df.index[1:][active]
+        finished_orders: list[FinishedOrder[_IndexType, Any]] = []
+        for (
+            index,
+            size_,
+            price_,
+            post_only_,
+            balance_decrement_,
+            executed_price_,
+            quote_size_,
+            fee_,
+            state_,
+        ) in zip(
+            settle_index.tolist(),
+            size[active].tolist(),
+            price[active].tolist(),
+            post_only[active].tolist(),
+            balance_decrement[active].tolist(),
+            executed_price[active].tolist(),
+            quote_size[active].tolist(),
+            fee[active].tolist(),
+            state[active].tolist(),
+        ):
+            finished_orders.append(
+                FinishedOrder(
+                    index=index,
+                    order=MarketOrder(size=size_)
+                    if np.isnan(price_)
+                    else LimitOrder(size=size_, price=price_, post_only=post_only_),
+                    balance_decrement=balance_decrement_,
+                    executed_price=None
+                    if np.isnan(executed_price_)
+                    else executed_price_,
+                    quote_size=quote_size_,
+                    fee=fee_,
+                    state=FinishedOrderState(state_),
+                )
+            )
 
         return BacktestResult(
             name=name,
             close=df["close"],
-            position=position_history.rename("position"),
-            position_quote=position_quote_history.rename("position_quote"),
-            balance_quote=balance_quote_history.rename("balance_quote"),
-            equity_quote=equity_quote_history.rename("equity_quote"),
-            finished_orders=finished_orders_exploded.rename("finished_orders"),
+            position=Series(position, index=df.index, name="position"),
+            position_quote=Series(
+                position_quote, index=df.index, name="position_quote"
+            ),
+            balance_quote=Series(balance, index=df.index, name="balance_quote"),
+            equity_quote=Series(equity, index=df.index, name="equity_quote"),
+            finished_orders=Series(
+                finished_orders,
+                index=settle_index,
+                dtype=object,
+                name="finished_orders",
+            ),
             maker_fee_rate=maker_fee,
             taker_fee_rate=taker_fee,
             logarithmic=logarithmic,
         )
 
+    @final
+    def sweep(
+        self,
+        df: DataFrame,
+        param_grid: Mapping[str, Sequence[Any]],
+        *,
+        maker_fee: float,
+        taker_fee: float,
+        balance_init: float = 1,
+        logarithmic: bool = True,
+        n_jobs: int = -1,
+        **kwargs: Any,
+    ) -> list[tuple[dict[str, Any], BacktestResult[_IndexType]]]:
+        """Run one full backtest per combination of parameters in parallel.
+
+        Each combination is set as attributes on a shallow copy
+        of the backtester, so `on_close` can read them from `self`.
+
+        Parameters
+        ----------
+        df : DataFrame
+            Must have columns 'open', 'close', 'high', 'low'.
+        param_grid : Mapping[str, Sequence[Any]]
+            Values to try for each attribute, every combination is run.
+        maker_fee : float
+            Maker fee.
+        taker_fee : float
+            Taker fee.
+        balance_init : float, optional
+            Initial balance, by default 1
+        logarithmic : bool, optional
+            Whether the results are logarithmic, by default True
+        n_jobs : int, optional
+            Number of jobs passed to joblib, by default -1
+        **kwargs : Any
+            Passed to `__call__`. `use_tqdm` defaults to False and `name`
+            to the parameters of each backtest. `n_splits` other than 1
+            is rejected, since the backtests already run in a process pool.
+
+        Returns
+        -------
+        list[tuple[dict[str, Any], BacktestResult]]
+            Parameters and result of each backtest, in the order of
+            `itertools.product` over `param_grid`.
+        """
+        if kwargs.get("n_splits", 1) != 1:
+            raise ValueError("n_splits must be 1 in sweep")
+        kwargs = {"use_tqdm": False, **kwargs}
+        name = kwargs.pop("name", None)
+        keys = list(param_grid)
+        params_list = [
+            dict(zip(keys, values))
+            for values in itertools.product(*(param_grid[key] for key in keys))
+        ]
+        results = joblib.Parallel(n_jobs=n_jobs, backend="loky", batch_size="auto")(
+            joblib.delayed(_run_with_params)(
+                self,
+                params,
+                df,
+                maker_fee=maker_fee,
+                taker_fee=taker_fee,
+                balance_init=balance_init,
+                logarithmic=logarithmic,
+                name=name
+                if name is not None
+                else ", ".join(f"{key}={value}" for key, value in params.items()),
+                **kwargs,
+            )
+            for params in params_list
+        )
+        if results is None:
+            raise ValueError("Joblib returned None.")
+        return list(zip(params_list, results))
+
     def init(self) -> None:
         """If you want to initialize something, override this method.
         Usually, you don't need to do this."""
@@ -332,5 +903,41 @@ class Backtester(Generic[_IndexType], metaclass=ABCMeta):
         data: CloseData
             CloseData object.
         row: Series
-            Row of the DataFrame passed to __call__."""
+            Row of the DataFrame passed to __call__.
+            With `lazy_row=True` it is only built as a Series when used as one."""
         yield from ()  # pragma: no cover
+
+    def on_close_vectorized(self, df: DataFrame) -> DataFrame:
+        """Override this method to implement your strategy for `vectorized_call`.
+        Unfilled orders would be automatically canceled.
+
+        Parameters
+        ----------
+        df: DataFrame
+            DataFrame passed to `vectorized_call`.
+
+        Returns
+        -------
+        DataFrame
+            The order placed on each close, with the same length as `df`
+            and columns 'size', 'price' and 'post_only'.
+            'price' may be NaN or omitted for market orders,
+            'post_only' is False if omitted,
+            and rows with 'size' 0 place no order."""
+        raise NotImplementedError(
+            f"{type(self).__name__} must override on_close_vectorized "
+            "to use vectorized_call"
+        )
+
+
+def _run_with_params(
+    backtester: Backtester[_IndexType],
+    params: Mapping[str, Any],
+    df: DataFrame,
+    **kwargs: Any,
+) -> BacktestResult[_IndexType]:
+    """Run a copy of `backtester` with `params` set as attributes."""
+    backtester = copy.copy(backtester)
+    for key, value in params.items():
+        setattr(backtester, key, value)
+    return backtester(df, **kwargs)
@@ -1,28 +1,209 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Any, Generic, TypeVar
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Generic, Iterable, NamedTuple, TypeVar
 
 import attrs
-import fitter
-import joblib
 import numpy as np
 import pandas as pd
-import pandas_ta as ta
-from matplotlib import pyplot as plt
-from matplotlib.figure import Figure
+from numpy.typing import NDArray
 from pandas import DataFrame, Series, Timedelta, Timestamp, concat
 from pandas.core.groupby.generic import SeriesGroupBy
-from plottable import ColDef, Table
 
-from backtrade.logic import FinishedOrder, FinishedOrderState
+from backtrade.finished_order import (
+    FinishedOrder,
+    FinishedOrderArrays,
+    FinishedOrderState,
+)
 
 from ..order import _IndexType
 
-__all__ = ["BacktestResult", "CloseData"]
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
+__all__ = ["BacktestResult", "CloseData", "CloseDataTuple"]
 
-@attrs.frozen(kw_only=True)
+
+def _sma(series: Series[float], length: int) -> Series[float] | None:
+    """Simple moving average, None if `series` is shorter than `length`.
+
+    Like `pandas_ta.sma`, a non-positive `length` falls back to 10."""
+    length = length if length > 0 else 10
+    if len(series) < length:
+        return None
+    return series.rolling(length, min_periods=length).mean()
+
+
+def _concat_sorted(s1: Series[Any], s2: Series[Any]) -> Series[Any]:
+    """Concatenate two Series and stable sort them by index,
+    without going through `concat`."""
+    index = s1.index.append(s2.index)
+    values = np.concatenate([s1.to_numpy(), s2.to_numpy()])
+    if not index.is_monotonic_increasing:
+        if s1.index.is_monotonic_increasing and s2.index.is_monotonic_increasing:
+            # Merge the two sorted inputs, ties keep the elements of s1 first
+            positions = np.concatenate(
+                [
+                    np.arange(len(s1)) + s2.index.searchsorted(s1.index, side="left"),
+                    np.arange(len(s2)) + s1.index.searchsorted(s2.index, side="right"),
+                ]
+            )
+            order = np.empty_like(positions)
+            order[positions] = np.arange(len(index))
+        else:
+            order = index.argsort(kind="stable")
+        index = index[order]
+        values = values[order]
+    return Series(values, index=index, name=s1.name if s1.name == s2.name else None)
+
+
+def _resample_first_ffill(series: Series[float], freq: Timedelta) -> Series[float]:
+    """Same as `series.resample(freq).first().ffill().dropna()`.
+
+    For a sorted, tz-naive DatetimeIndex without NaN, the bins are computed
+    from the int64 timestamps directly instead of going through a Resampler."""
+    index = series.index
+    values = series.to_numpy(dtype=np.float64)
+    if (
+        not isinstance(index, pd.DatetimeIndex)
+        or index.tz is not None
+        or len(index) == 0
+        or not index.is_monotonic_increasing
+        or np.isnan(values).any()
+    ):
+        return series.resample(freq).first().ffill().dropna()
+
+    # Bins are anchored at midnight of the first day, like resample
+    step = Timedelta(freq).value
+    timestamps = index.asi8
+    origin = timestamps[0] - timestamps[0] % Timedelta(days=1).value
+    bins = (timestamps - origin) // step
+    first_bin = bins[0]
+    unique_bins, first_positions = np.unique(bins, return_index=True)
+    resampled = np.full(bins[-1] - first_bin + 1, np.nan)
+    resampled[unique_bins - first_bin] = values[first_positions]
+    return Series(
+        _ffill_bfill(resampled),
+        index=pd.date_range(
+            start=Timestamp(origin + first_bin * step),
+            periods=len(resampled),
+            freq=freq,
+            name=index.name,
+        ),
+        name=series.name,
+    )
+
+
+def _dedup_names(names: Iterable[Any]) -> list[Any]:
+    """Rename duplicated names to "name.1", "name.2", ... like `read_csv` does."""
+    counts: dict[Any, int] = {}
+    deduped = []
+    for name in names:
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts.get(name, 0)
+        deduped.append(name)
+        counts[name] = count + 1
+    return deduped
+
+
+def _ffill_bfill(values: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Fill NaNs with the previous valid value, then the leading ones
+    with the first valid value, along the first axis."""
+    valid = ~np.isnan(values)
+    if valid.all():
+        return values
+    rows = np.arange(len(values)).reshape((-1,) + (1,) * (values.ndim - 1))
+    positions = np.where(valid, rows, 0)
+    np.maximum.accumulate(positions, axis=0, out=positions)
+    first_valid = valid.argmax(axis=0)
+    positions = np.where(rows < first_valid, first_valid, positions)
+    return np.take_along_axis(values, positions, axis=0)
+
+
+def _union_ffill_bfill(
+    s1: Series[float], s2: Series[float]
+) -> tuple[pd.Index, NDArray[np.float64], NDArray[np.float64]]:
+    """Align two Series on the union of their indexes, forward then backward filled.
+
+    Equivalent to `s.reindex(new_index).ffill().bfill()` for both Series,
+    without the intermediate Series."""
+    new_index = s1.index.union(s2.index)
+    aligned = []
+    for s in (s1, s2):
+        values = np.full(len(new_index), np.nan)
+        values[new_index.get_indexer(s.index)] = s.to_numpy(dtype=np.float64)
+        aligned.append(_ffill_bfill(values))
+    return new_index, aligned[0], aligned[1]
+
+
+class _ProfitStats(NamedTuple):
+    mean: float
+    median: float
+    std: float
+    neg_std: float
+    skew: float
+    kurt: float
+
+    @classmethod
+    def from_profit(cls, profit: Series[float]) -> _ProfitStats:
+        """Same values as the pandas reductions (skipna, ddof=1,
+        bias-corrected skew and excess kurtosis), mostly from one `describe` pass."""
+        values = profit.to_numpy(dtype=np.float64)
+        values = values[~np.isnan(values)]
+        negative = values[values < 0]
+        count = len(values)
+        neg_std = negative.std(ddof=1) if len(negative) > 1 else np.nan
+        if count < 2:
+            mean = values.mean() if count > 0 else np.nan
+            return cls(
+                mean=mean,
+                median=mean,
+                std=np.nan,
+                neg_std=neg_std,
+                skew=np.nan,
+                kurt=np.nan,
+            )
+        if (values == values[0]).all():
+            # scipy warns about precision loss for constant data
+            return cls(
+                mean=values[0],
+                median=values[0],
+                std=0.0,
+                neg_std=neg_std,
+                skew=0.0 if count > 2 else np.nan,
+                kurt=0.0 if count > 3 else np.nan,
+            )
+        # Imported here, scipy.stats takes about 0.3s to import
+        import scipy.stats
+
+        description = scipy.stats.describe(values, ddof=1, bias=False)
+        return cls(
+            mean=description.mean,
+            median=np.median(values),
+            std=description.variance**0.5,
+            neg_std=neg_std,
+            skew=description.skewness if count > 2 else np.nan,
+            kurt=description.kurtosis if count > 3 else np.nan,
+        )
+
+
+# Cached properties which depend on `logarithmic` or `freq`
+_PROFIT_CACHED_PROPERTIES = ("_profit", "_profit_stats")
+
+
+def _clear_profit_cache(
+    instance: BacktestResult[Any], attribute: attrs.Attribute[Any], value: Any
+) -> Any:
+    for name in _PROFIT_CACHED_PROPERTIES:
+        instance.__dict__.pop(name, None)
+    return value
+
+
+@attrs.frozen(kw_only=True, weakref_slot=False)
 class CloseData(Generic[_IndexType]):
     index: _IndexType
     open: float
@@ -35,7 +216,25 @@ class CloseData(Generic[_IndexType]):
     equity_quote: float
 
 
-@attrs.define(kw_only=True)
+class CloseDataTuple(NamedTuple):
+    """Same fields as `CloseData`, but much cheaper to construct.
+
+    Passed to `on_close` instead of `CloseData` when the backtest
+    is run with `fast_close_data=True`.
+    NamedTuple cannot be generic before Python 3.11, so `index` is untyped."""
+
+    index: Any
+    open: float
+    high: float
+    low: float
+    close: float
+    position: float
+    position_quote: float
+    balance_quote: float
+    equity_quote: float
+
+
+@attrs.define(kw_only=True, slots=False)
 class BacktestResult(Generic[_IndexType]):
     name: str | None = attrs.field(on_setattr=attrs.setters.frozen)
     close: Series[float] | DataFrame = attrs.field(on_setattr=attrs.setters.frozen)
@@ -49,29 +248,9 @@ class BacktestResult(Generic[_IndexType]):
         on_setattr=attrs.setters.frozen
     )
 
-    logarithmic: bool = attrs.field(on_setattr=attrs.setters.NO_OP)
+    logarithmic: bool = attrs.field(on_setattr=_clear_profit_cache)
     freq: Timedelta = attrs.field(
-        default=Timedelta("1d"), init=False, on_setattr=attrs.setters.NO_OP
-    )
-    _profit_memory: joblib.Memory = attrs.field(
-        default=joblib.Memory(),
-        init=False,
-        on_setattr=attrs.setters.NO_OP,
-        repr=False,
-        eq=False,
-        order=False,
-        hash=False,
-        metadata={"pickle": False},
-    )
-    _finished_orders_by_index_memory: joblib.Memory = attrs.field(
-        default=joblib.Memory(),
-        init=False,
-        on_setattr=attrs.setters.frozen,
-        repr=False,
-        eq=False,
-        order=False,
-        hash=False,
-        metadata={"pickle": False},
+        default=Timedelta("1d"), init=False, on_setattr=_clear_profit_cache
     )
 
     def __add__(self, other: BacktestResult[_IndexType]) -> BacktestResult[_IndexType]:
@@ -84,15 +263,13 @@ class BacktestResult(Generic[_IndexType]):
 
         _TSeries = TypeVar("_TSeries", bound="Series")
 
-        def reindex_fill(s1: _TSeries, s2: _TSeries) -> tuple[_TSeries, _TSeries]:
-            new_index = s1.index.union(s2.index)
-            s1 = s1.reindex(new_index).ffill().bfill()
-            s2 = s2.reindex(new_index).ffill().bfill()
-            return s1, s2
-
         def add_fbfill(s1: _TSeries, s2: _TSeries) -> _TSeries:
-            s1, s2 = reindex_fill(s1, s2)
-            return s1 + s2
+            new_index, values_1, values_2 = _union_ffill_bfill(s1, s2)
+            return Series(  # type: ignore
+                values_1 + values_2,
+                index=new_index,
+                name=s1.name if s1.name == s2.name else None,
+            )
 
         def add_fill0(s1: _TSeries, s2: _TSeries) -> _TSeries:
             return s1.add(s2, fill_value=0)
@@ -108,30 +285,35 @@ class BacktestResult(Generic[_IndexType]):
             if isinstance(close_2, Series):
                 close_2.rename(f"{other.name}_Close", inplace=True)
 
-            # Concat
+            # Concat, filled and built from one float64 array
+            # so that it is stored as a single block
 
-            new_close = (
-                concat([close_1, close_2], axis=close_concat_axis).ffill().bfill()
+            new_close = concat([close_1, close_2], axis=close_concat_axis)
+            new_close = DataFrame(
+                _ffill_bfill(new_close.to_numpy(dtype=np.float64)),
+                index=new_close.index,
+                columns=new_close.columns,
             )
 
             # Avoid duplicate columns
-            def rename_duplicated(df: DataFrame) -> None:
-                from pandas.io.parsers.base_parser import ParserBase
-
-                df.columns = ParserBase({"usecols": None})._maybe_dedup_names(
-                    df.columns
-                )
-
-            rename_duplicated(new_close)
+            new_close.columns = _dedup_names(new_close.columns)
         else:
             new_close = concat([close_1, close_2], axis=close_concat_axis)
+            if isinstance(new_close, DataFrame):
+                # Keep a single float64 block, concat of frames
+                # with different columns leaves one block per input
+                new_close = DataFrame(
+                    new_close.to_numpy(dtype=np.float64),
+                    index=new_close.index,
+                    columns=new_close.columns,
+                )
 
         balance_quote_1 = self.balance_quote
         balance_quote_2 = other.balance_quote
-        balance_quote_1.iat[-1] = self.equity_quote.iat[-1]
-        balance_quote_2.iat[-1] = other.equity_quote.iat[-1]
-        balance_quote_1.iat[0] = self.equity_quote.iat[0]
-        balance_quote_2.iat[0] = other.equity_quote.iat[0]
+        balance_quote_1.iat[-1] = self._equity_arr[-1]
+        balance_quote_2.iat[-1] = other._equity_arr[-1]
+        balance_quote_1.iat[0] = self._equity_arr[0]
+        balance_quote_2.iat[0] = other._equity_arr[0]
         return BacktestResult(
             name=f"{self.name} + {other.name}",
             close=new_close,
@@ -145,14 +327,12 @@ class BacktestResult(Generic[_IndexType]):
             taker_fee_rate=self.taker_fee_rate
             if self.taker_fee_rate == other.taker_fee_rate
             else np.nan,
-            finished_orders=concat(
-                [self.finished_orders, other.finished_orders], sort=True
-            ),
+            finished_orders=_concat_sorted(self.finished_orders, other.finished_orders),
             logarithmic=self.logarithmic,
         )
 
     def __mul__(self, other: float) -> BacktestResult[_IndexType]:
-        if not isinstance(other, float):
+        if not isinstance(other, (int, float)):
             return NotImplemented  # type: ignore
         if other < 0:
             raise ValueError(f"Cannot multiply by negative number: {other}")
@@ -166,9 +346,24 @@ class BacktestResult(Generic[_IndexType]):
             finished_orders=self.finished_orders * other,
         )
 
-    def __div__(self, other: float) -> BacktestResult[_IndexType]:
-        return self * (1 / other)
+    def __truediv__(self, other: float) -> BacktestResult[_IndexType]:
+        if not isinstance(other, (int, float)):
+            return NotImplemented  # type: ignore
+        if other < 0:
+            raise ValueError(f"Cannot divide by negative number: {other}")
+
+        return attrs.evolve(
+            self,
+            position=self.position / other,
+            position_quote=self.position_quote / other,
+            balance_quote=self.balance_quote / other,
+            equity_quote=self.equity_quote / other,
+            finished_orders=self.finished_orders / other,
+        )
+
+    __div__ = __truediv__
 
+    @cached_property
     def _finished_orders_by_index(
         self,
     ) -> SeriesGroupBy[FinishedOrder[_IndexType @ BacktestResult, Any]]:
@@ -178,24 +373,38 @@ class BacktestResult(Generic[_IndexType]):
     def finished_orders_by_index(
         self,
     ) -> SeriesGroupBy[FinishedOrder[_IndexType @ BacktestResult, Any]]:
-        return self._finished_orders_by_index_memory.cache(
-            self._finished_orders_by_index
-        )()
+        return self._finished_orders_by_index
+
+    @cached_property
+    def _orders_per_index(self) -> DataFrame:
+        """Count and filled rate of the finished orders of each index,
+        computed in one groupby over the filled flags."""
+        grouped = Series(
+            self._orders.filled,
+            index=self.finished_orders.index,
+            dtype=np.float64,
+            name=self.finished_orders.name,
+        ).groupby(level=0, sort=False)
+        return DataFrame({"count": grouped.size(), "filled_rate": grouped.mean()})
 
     @property
     def order_count(self) -> Series[int]:
-        return self.finished_orders_by_index.count().reindex(
-            self.close.index, fill_value=0
+        return (
+            self._orders_per_index["count"]
+            .reindex(self.close.index, fill_value=0)
+            .rename(self.finished_orders.name)
         )
 
     @property
     def filled_rate(self) -> Series[float]:
-        return self.finished_orders_by_index.apply(
-            lambda series: series.apply(lambda order: order.filled).mean()
-        ).reindex(self.close.index)
+        return (
+            self._orders_per_index["filled_rate"]
+            .reindex(self.close.index)
+            .rename(self.finished_orders.name)
+        )
 
-    @property
-    def period(self) -> Timedelta:
+    @cached_property
+    def _period(self) -> Timedelta:
         first_index = self.close.index[0]
         last_index = self.close.index[-1]
 
@@ -210,155 +419,203 @@ class BacktestResult(Generic[_IndexType]):
         else:
             raise TypeError("Index must be Timestamp or Timedelta")
 
+    @property
+    def period(self) -> Timedelta:
+        return self._period
+
+    @cached_property
+    def _annual_scale(self) -> float:
+        """Factor annualizing the standard deviation of the profit over `period`."""
+        return (Timedelta(days=365) / self.period) ** 0.5
+
+    @cached_property
     def _profit(self) -> Series[float]:
-        equity_resampled = (
-            self.equity_quote.resample(self.freq)
-            .first()
-            .fillna(method="ffill")
-            .dropna()
-        )
+        equity_resampled = _resample_first_ffill(self.equity_quote, self.freq)
         if self.logarithmic:
-            profit = equity_resampled.pct_change() - 1
+            # Log returns, NaN or -inf where the equity is not positive
+            with np.errstate(divide="ignore", invalid="ignore"):
+                profit = np.log(equity_resampled).diff()
         else:
             profit = equity_resampled.diff()
         return profit
 
     @property
     def profit(self) -> Series[float]:
-        return self._profit_memory.cache(self._profit)()
+        return self._profit
+
+    @cached_property
+    def _profit_stats(self) -> _ProfitStats:
+        return _ProfitStats.from_profit(self.profit)
 
     @property
     def annual_sharp_ratio(self) -> float:
-        return self.profit.mean() / self.annual_volatility
+        return self._profit_stats.mean / self.annual_volatility
 
     @property
     def annual_sortino_ratio(self) -> float:
-        return (
-            self.profit.mean()
-            / self.profit[self.profit < 0].std()
-            * (Timedelta(days=365) / self.period) ** 0.5
-        )
+        return self._profit_stats.mean / self._profit_stats.neg_std * self._annual_scale
+
+    @cached_property
+    def _equity_arr(self) -> NDArray[np.float64]:
+        """`equity_quote` as a contiguous array, so that the metrics
+        index and scan it without going through pandas."""
+        return np.ascontiguousarray(self.equity_quote.to_numpy(dtype=np.float64))
+
+    @cached_property
+    def _max_drawdown_ratio(self) -> float:
+        equity = self._equity_arr
+        return np.nanmax(1 - equity / np.maximum.accumulate(equity))
 
     @property
     def max_drawdown(self) -> float:
         if self.logarithmic:
-            return ta.max_drawdown(self.equity_quote, method="percent")
+            return self._max_drawdown_ratio
         else:
-            return (
-                ta.max_drawdown(self.equity_quote, method="percent")
-                * self.equity_quote.iat[0]
-            )
+            return self._max_drawdown_ratio * self._equity_arr[0]
 
     @property
     def annual_volatility(self) -> float:
-        return self.profit.std() * (Timedelta(days=365) / self.period) ** 0.5
+        return self._profit_stats.std * self._annual_scale
+
+    @cached_property
+    def _orders(self) -> FinishedOrderArrays:
+        """`finished_orders` as parallel arrays, built once for the metrics."""
+        return FinishedOrderArrays.from_orders(
+            self.finished_orders.index, self.finished_orders
+        )
 
     @property
+    def finished_orders_frame(self) -> DataFrame:
+        """`finished_orders` with one typed column per field
+        (`state` holds `FinishedOrderState.value`), indexed like `finished_orders`.
+        """
+        return self._orders.to_frame().set_axis(self.finished_orders.index)
+
+    @cached_property
+    def _orders_by_state(self) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+        """Count and total fee of the finished orders of each state,
+        indexed by `FinishedOrderState.value`."""
+        orders = self._orders
+        minlength = len(FinishedOrderState)
+        return (
+            np.bincount(orders.state, minlength=minlength),
+            np.bincount(orders.state, weights=orders.fee, minlength=minlength),
+        )
+
+    @cached_property
+    def _state_ratios(self) -> NDArray[np.float64]:
+        """Ratio of the finished orders of each state,
+        indexed by `FinishedOrderState.value`, NaN if there is no order."""
+        counts = self._orders_by_state[0]
+        if len(self._orders) == 0:
+            return np.full(len(counts), np.nan)
+        return counts / len(self._orders)
+
+    def _state_ratio(self, state: FinishedOrderState) -> float:
+        return self._state_ratios[state.value]
+
+    @cached_property
     def total_fee(self) -> float:
-        return self.finished_orders.apply(lambda x: x.fee).sum()
+        return self._orders.fee.sum()
 
     @property
     def total_maker_fee(self) -> float:
-        return self.finished_orders.apply(
-            lambda x: x.fee if x.state == FinishedOrderState.FilledMaker else 0
-        ).sum()
+        return self._orders_by_state[1][FinishedOrderState.FilledMaker.value]
 
     @property
     def total_taker_fee(self) -> float:
-        return self.finished_orders.apply(
-            lambda x: x.fee if x.state == FinishedOrderState.FilledTaker else 0
-        ).sum()
+        return self._orders_by_state[1][FinishedOrderState.FilledTaker.value]
 
     @property
     def fee_ratio(self) -> float:
         return self.total_fee / (
-            self.equity_quote.iat[-1] - self.equity_quote.iat[0] + self.total_fee
+            self._equity_arr[-1] - self._equity_arr[0] + self.total_fee
         )
 
     @property
     def total_orders_count(self) -> int:
         return self.finished_orders.size
 
-    @property
+    @cached_property
     def total_order_amount(self) -> float:
-        return self.finished_orders.apply(lambda x: abs(x.quote_size)).sum()
+        return np.abs(self._orders.quote_size).sum()
 
     @property
     def state_maker_ratio(self) -> float:
-        return self.finished_orders.apply(
-            lambda x: 1 if x.state == FinishedOrderState.FilledMaker else 0
-        ).mean()
+        return self._state_ratio(FinishedOrderState.FilledMaker)
 
     @property
     def state_taker_ratio(self) -> float:
-        return self.finished_orders.apply(
-            lambda x: 1 if x.state == FinishedOrderState.FilledTaker else 0
-        ).mean()
+        return self._state_ratio(FinishedOrderState.FilledTaker)
 
     @property
     def state_cancelled_not_filled_ratio(self) -> float:
-        return self.finished_orders.apply(
-            lambda x: 1 if x.state == FinishedOrderState.CancelledNotFilled else 0
-        ).mean()
+        return self._state_ratio(FinishedOrderState.CancelledNotFilled)
 
     @property
     def state_cancelled_post_only_ratio(self) -> float:
-        return self.finished_orders.apply(
-            lambda x: 1 if x.state == FinishedOrderState.CancelledPostOnly else 0
-        ).mean()
+        return self._state_ratio(FinishedOrderState.CancelledPostOnly)
 
     @property
     def win_ratio(self) -> float:
-        return self.profit.apply(lambda x: 1 if x > 0 else 0).mean()
+        # NaN profits count as losses, like comparing them one by one
+        profit = self.profit.to_numpy(dtype=np.float64)
+        return (profit > 0).mean() if len(profit) > 0 else np.nan
 
     @property
     def _all_metrics(self) -> Series:
-        s = Series(
+        state_names = {
+            "State: Maker": FinishedOrderState.FilledMaker,
+            "State: Taker": FinishedOrderState.FilledTaker,
+            "State: Cancelled (Not Filled)": FinishedOrderState.CancelledNotFilled,
+            "State: Cancelled (Post Only)": FinishedOrderState.CancelledPostOnly,
+        }
+        if self.total_orders_count > 0:
+            state_strs = {
+                name: f"{self._state_ratio(state):.3%}"
+                for name, state in state_names.items()
+            }
+        else:
+            state_strs = dict.fromkeys(state_names, "N/A")
+        metrics = {
+            "Frequency (User Specified)": self.freq,
+            "Logarithmic (User Specified)": self.logarithmic,
+            "Period": self.period,
+            "Win Ratio": self.win_ratio,
+            "Profit Average": self._profit_stats.mean,
+            "Profit Median": self._profit_stats.median,
+            "Profit Std": self._profit_stats.std,
+            "Profit Skewness": self._profit_stats.skew,
+            "Profit Kurtosis": self._profit_stats.kurt,
+            "Annual Volatility": self.annual_volatility,
+            "Annual Sharp Ratio": self.annual_sharp_ratio,
+            "Annual Sortino Ratio": self.annual_sortino_ratio,
+            "Max Drawdown": f"{self.max_drawdown:.3%}",
+            "Maker Fee Rate (User Specified)": f"{self.maker_fee_rate:.5%}",
+            "Taker Fee Rate (User Specified)": f"{self.taker_fee_rate:.5%}",
+            "Total Fee": self.total_fee,
+            "Total Maker Fee": self.total_maker_fee,
+            "Total Taker Fee": self.total_taker_fee,
+            "Total Fee / Total Profit without Fee": f"{self.fee_ratio:.3%}",
+            "Total Order Amount": self.total_order_amount,
+            "Total Orders Count": self.total_orders_count,
+            **state_strs,
+        }
+        # Format the floats while building the Series rather than scanning it
+        return Series(
             {
-                "Frequency (User Specified)": self.freq,
-                "Logarithmic (User Specified)": self.logarithmic,
-                "Period": self.period,
-                "Win Ratio": self.win_ratio,
-                "Profit Average": self.profit.mean(),
-                "Profit Median": self.profit.median(),
-                "Profit Std": self.profit.std(),
-                "Profit Skewness": self.profit.skew(),
-                "Profit Kurtosis": self.profit.kurt(),
-                "Annual Volatility": self.annual_volatility,
-                "Annual Sharp Ratio": self.annual_sharp_ratio,
-                "Annual Sortino Ratio": self.annual_sortino_ratio,
-                "Max Drawdown": f"{self.max_drawdown:.3%}",
-                "Maker Fee Rate (User Specified)": f"{self.maker_fee_rate:.5%}",
-                "Taker Fee Rate (User Specified)": f"{self.taker_fee_rate:.5%}",
-                "Total Fee": self.total_fee,
-                "Total Maker Fee": self.total_maker_fee,
-                "Total Taker Fee": self.total_taker_fee,
-                "Total Fee / Total Profit without Fee": f"{self.fee_ratio:.3%}",
-                "Total Order Amount": self.total_order_amount,
-                "Total Orders Count": self.total_orders_count,
-                "State: Maker": f"{self.state_maker_ratio:.3%}"
-                if self.total_orders_count > 0
-                else "N/A",
-                "State: Taker": f"{self.state_taker_ratio:.3%}"
-                if self.total_orders_count > 0
-                else "N/A",
-                "State: Cancelled (Not Filled)"
-                + "": f"{self.state_cancelled_not_filled_ratio:.3%}"
-                if self.total_orders_count > 0
-                else "N/A",
-                "State: Cancelled (Post Only)"
-                + "": f"{self.state_cancelled_post_only_ratio:.3%}"
-                if self.total_orders_count > 0
-                else "N/A",
+                name: f"{value:.3f}" if isinstance(value, float) else value
+                for name, value in metrics.items()
             },
             name="Value",
         ).rename_axis("Metric Name")
-        s[s.apply(lambda x: isinstance(x, float))] = s[
-            s.apply(lambda x: isinstance(x, float))
-        ].apply(lambda x: f"{x:.3f}")
-        return s
 
     def plot(self, *, use_fitter: bool = False) -> Figure:
+        # Plotting libraries are only imported when plotting,
+        # fitter alone takes about half a second to import
+        from matplotlib import pyplot as plt
+        from plottable import ColDef, Table
+
         # Create Subfigures
         fig = plt.figure(figsize=(16, 9), constrained_layout=True)
         fig.suptitle(f"Backtest for {self.name}", fontsize=16)
@@ -369,51 +626,41 @@ class BacktestResult(Generic[_IndexType]):
         data_len = len(self.close)
         sma_len = data_len // 20
 
-        filled_rate_sma = ta.sma(self.filled_rate.dropna(), length=sma_len)
+        filled_rate_sma = _sma(self.filled_rate.dropna(), sma_len)
         if filled_rate_sma is not None:
             filled_rate_sma.rename("Filled Rate SMA", inplace=True)
         else:
             filled_rate_sma = Series(
                 name="Filled Rate SMA (N/A, Not Enough Data)", dtype=float
             )
-        order_count_sma = ta.sma(self.order_count.dropna(), length=sma_len)
+        order_count_sma = _sma(self.order_count.dropna(), sma_len)
         if order_count_sma is not None:
             order_count_sma.rename("Order Count SMA", inplace=True)
         else:
             order_count_sma = Series(
                 name="Order Count SMA (N/A, Not Enough Data)", dtype=float
             )
-        df = concat(
-            [
-                self.close
-                if isinstance(self.close, Series)
-                else self.close.div(self.close.max(axis=0), axis=1),
-                self.position.rename("Position"),
-                self.position_quote.rename("Position (Quote)"),
-                self.balance_quote.rename("Balance (Quote)"),
-                self.equity_quote.rename("Equity (Quote)"),
-                self.filled_rate.rename("Filled Rate"),
-                filled_rate_sma,
-                self.order_count.rename("Order Count"),
-                order_count_sma,
-            ],
-            axis=1,
-        )
-        df.plot(
-            subplots=[
-                self.close.columns
-                if isinstance(self.close, DataFrame)
-                else [self.close.name],
-                ["Position"],
-                ["Position (Quote)"],
-                ["Balance (Quote)"],
-                ["Equity (Quote)"],
-                df.columns[df.columns.str.contains("Filled Rate")],
-                df.columns[df.columns.str.contains("Order Count")],
-            ],
-            ax=axes,
-            kind="line",
+        # Plot each Series on its own axis instead of concatenating them first
+        close = (
+            self.close
+            if isinstance(self.close, Series)
+            else self.close.div(self.close.max(axis=0), axis=1)
         )
+        table_data: list[Series[Any] | DataFrame] = [
+            close,
+            self.position.rename("Position"),
+            self.position_quote.rename("Position (Quote)"),
+            self.balance_quote.rename("Balance (Quote)"),
+            self.equity_quote.rename("Equity (Quote)"),
+            self.filled_rate.rename("Filled Rate"),
+            self.order_count.rename("Order Count"),
+        ]
+        plot_data = table_data[:5] + [
+            DataFrame({rate.name: rate, sma.name: sma.reindex(self.close.index)})
+            for rate, sma in zip(table_data[5:], [filled_rate_sma, order_count_sma])
+        ]
+        for ax, data in zip(axes, plot_data):
+            data.plot(ax=ax, kind="line", legend=True)
         if self.logarithmic:
             for i in [1, 2, 3, 4]:
                 axes[i].set_yscale("log")
@@ -429,14 +676,18 @@ class BacktestResult(Generic[_IndexType]):
             },
         )
 
-        df.index.name = "DateTime"
-        df = df.loc[:, ~df.columns.str.contains("SMA")]
-        df.columns = df.columns.str.replace(" ", "\n")
+        def table_frame(rows: slice) -> DataFrame:
+            df = concat([data.iloc[rows] for data in table_data], axis=1)
+            df.index.name = "DateTime"
+            df.columns = df.columns.str.replace(" ", "\n")
+            return df.round(2)
 
         # Metrics
         Table(self._all_metrics.to_frame(), ax=axes[0])
 
         if use_fitter:
+            import fitter
+
             plt.sca(axes[1])
             fitter_ = fitter.Fitter(
                 self.profit.dropna(), distributions=fitter.get_common_distributions()
@@ -461,13 +712,13 @@ class BacktestResult(Generic[_IndexType]):
         ]
         textprops = {"size": 9.5}
         Table(
-            df.head(10).round(2),
+            table_frame(slice(None, 10)),
             ax=axes[3 if use_fitter else 2],
             column_definitions=coldefs,
             textprops=textprops,
         )
         Table(
-            df.tail(10).round(2),
+            table_frame(slice(-10, None)),
             ax=axes[4 if use_fitter else 3],
             column_definitions=coldefs,
             textprops=textprops,
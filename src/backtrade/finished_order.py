@@ -1,21 +1,25 @@
 from __future__ import annotations
 
-from enum import Enum
-from typing import Generic
+from enum import IntEnum
+from operator import attrgetter
+from typing import Any, Generic, Iterable
 
 import attrs
+import numpy as np
+import pandas as pd
+from numpy.typing import ArrayLike, NDArray
 
 from .order import _IndexType, _OrderType
 
 
-class FinishedOrderState(Enum):
+class FinishedOrderState(IntEnum):
     FilledTaker = 0
     FilledMaker = 1
     CancelledNotFilled = 2
     CancelledPostOnly = 3
 
 
-@attrs.frozen(kw_only=True)
+@attrs.frozen(kw_only=True, weakref_slot=False)
 class FinishedOrder(Generic[_IndexType, _OrderType]):
     index: _IndexType
     order: _OrderType
@@ -33,17 +37,101 @@ class FinishedOrder(Generic[_IndexType, _OrderType]):
         )
 
     def __mul__(self, other: float) -> FinishedOrder[_IndexType, _OrderType]:
-        if not isinstance(other, float):
+        if not isinstance(other, (int, float)):
             return NotImplemented  # type: ignore
         if other < 0:
             raise ValueError(f"Cannot multiply by negative number: {other}")
-        return attrs.evolve(
-            self,
+        # Built directly rather than with attrs.evolve,
+        # a whole Series of finished orders is scaled at once
+        return FinishedOrder(
+            index=self.index,
             order=self.order * other,
             balance_decrement=self.balance_decrement * other,
+            executed_price=self.executed_price,
             quote_size=self.quote_size * other,
             fee=self.fee * other,
+            state=self.state,
         )
 
-    def __div__(self, other: float) -> FinishedOrder[_IndexType, _OrderType]:
-        return self * (1 / other)
+    def __truediv__(self, other: float) -> FinishedOrder[_IndexType, _OrderType]:
+        if not isinstance(other, (int, float)):
+            return NotImplemented  # type: ignore
+        if other < 0:
+            raise ValueError(f"Cannot divide by negative number: {other}")
+        return FinishedOrder(
+            index=self.index,
+            order=self.order / other,
+            balance_decrement=self.balance_decrement / other,
+            executed_price=self.executed_price,
+            quote_size=self.quote_size / other,
+            fee=self.fee / other,
+            state=self.state,
+        )
+
+    __div__ = __truediv__
+
+
+@attrs.frozen(kw_only=True, eq=False)
+class FinishedOrderArrays:
+    """Fields of many `FinishedOrder` stored as parallel arrays."""
+
+    index: NDArray[Any]
+    balance_decrement: NDArray[np.float64]
+    executed_price: NDArray[np.float64]
+    fee: NDArray[np.float64]
+    quote_size: NDArray[np.float64]
+    state: NDArray[np.int8]
+    filled: NDArray[np.bool_]
+
+    @classmethod
+    def from_orders(
+        cls, index: ArrayLike, orders: Iterable[FinishedOrder[Any, Any]]
+    ) -> FinishedOrderArrays:
+        orders = list(orders)
+        count = len(orders)
+        state = np.fromiter(
+            map(attrgetter("state"), orders), dtype=np.int8, count=count
+        )
+        return cls(
+            index=np.asarray(index),
+            balance_decrement=np.fromiter(
+                map(attrgetter("balance_decrement"), orders),
+                dtype=np.float64,
+                count=count,
+            ),
+            # NaN for the orders which were not filled
+            executed_price=np.fromiter(
+                (
+                    np.nan if price is None else price
+                    for price in map(attrgetter("executed_price"), orders)
+                ),
+                dtype=np.float64,
+                count=count,
+            ),
+            fee=np.fromiter(
+                map(attrgetter("fee"), orders), dtype=np.float64, count=count
+            ),
+            quote_size=np.fromiter(
+                map(attrgetter("quote_size"), orders), dtype=np.float64, count=count
+            ),
+            state=state,
+            filled=(state == FinishedOrderState.FilledTaker.value)
+            | (state == FinishedOrderState.FilledMaker.value),
+        )
+
+    def __len__(self) -> int:
+        return len(self.state)
+
+    def to_frame(self) -> pd.DataFrame:
+        """One typed column per field, indexed by `index`."""
+        return pd.DataFrame(
+            {
+                "balance_decrement": self.balance_decrement,
+                "executed_price": self.executed_price,
+                "quote_size": self.quote_size,
+                "fee": self.fee,
+                "state": self.state,
+                "filled": self.filled,
+            },
+            index=self.index,
+        )
@@ -1,6 +1,11 @@
+from __future__ import annotations
+
+import math
 from typing import Generic
 
 import attrs
+import numpy as np
+from numpy.typing import NDArray
 
 from .finished_order import FinishedOrder, FinishedOrderState
 from .order import LimitOrder, _IndexType, _OrderType
@@ -32,73 +37,214 @@ class ProcessBuyOrderArgs(ProcessOrderArgsBase[_IndexType, _OrderType]):
 
 
 def to_limit_order(args: ToLimitOrderArgs[_OrderType]) -> LimitOrder:
-    if isinstance(args.order, LimitOrder):
-        return args.order
-    if args.order.size > 0:
+    order = args.order
+    if isinstance(order, LimitOrder):
+        return order
+    size = order.size
+    if size > 0:
         price = args.last_close * 2
-    elif args.order.size < 0:
+    elif size < 0:
         price = args.last_close / 2
     else:
         price = args.last_close
     return LimitOrder(
-        size=args.order.size,
+        size=size,
         price=price,
         post_only=False,
     )
 
 
-def process_buy_order(
-    args: ProcessBuyOrderArgs[_IndexType, _OrderType]
-) -> "FinishedOrder[_IndexType, _OrderType]":
-    if args.order.size <= 0:
-        raise ValueError("Buy order size must be positive")
-    limit_order = to_limit_order(args)
-    if limit_order.price >= args.last_close:
-        # taker
-        if limit_order.post_only:
-            return FinishedOrder(
-                index=args.index,  # type: ignore
-                order=args.order,  # type: ignore
-                balance_decrement=0,
-                executed_price=None,
-                quote_size=0,
-                fee=0,
-                state=FinishedOrderState.CancelledPostOnly,
+def process_market_order_scalar(
+    size: float, last_close: float, taker_fee: float
+) -> tuple[float, float, float, float, FinishedOrderState]:
+    """Process a market order given as scalars.
+
+    Market orders are always filled as taker at `last_close`.
+
+    Returns
+    -------
+    tuple[float, float, float, float, FinishedOrderState]
+        balance_decrement, executed_price, quote_size, fee and state
+        of the `FinishedOrder`.
+    """
+    if size > 0:
+        balance_decrement = size * last_close * (1 + taker_fee)
+    elif size < 0:
+        balance_decrement = size * last_close * (1 - taker_fee)
+    else:
+        raise ValueError("Order size must be non-zero")
+    return (
+        balance_decrement,
+        last_close,
+        size * last_close,
+        abs(size) * last_close * taker_fee,
+        FinishedOrderState.FilledTaker,
+    )
+
+
+def process_limit_order_scalar(
+    size: float,
+    price: float,
+    post_only: bool,
+    last_close: float,
+    high: float,
+    low: float,
+    maker_fee: float,
+    taker_fee: float,
+) -> tuple[float, float | None, float, float, FinishedOrderState]:
+    """Process a limit order given as scalars, without allocating any args object.
+
+    Returns
+    -------
+    tuple[float, float | None, float, float, FinishedOrderState]
+        balance_decrement, executed_price, quote_size, fee and state
+        of the `FinishedOrder`.
+    """
+    if size > 0:
+        if price >= last_close:
+            # taker
+            if post_only:
+                return 0.0, None, 0.0, 0.0, FinishedOrderState.CancelledPostOnly
+            return (
+                size * last_close * (1 + taker_fee),
+                last_close,
+                size * last_close,
+                size * last_close * taker_fee,
+                FinishedOrderState.FilledTaker,
+            )
+        if price >= low:
+            return (
+                size * price * (1 + maker_fee),
+                price,
+                size * price,
+                size * price * maker_fee,
+                FinishedOrderState.FilledMaker,
+            )
+        return 0.0, None, 0.0, 0.0, FinishedOrderState.CancelledNotFilled
+    elif size < 0:
+        if price <= last_close:
+            # taker
+            if post_only:
+                return 0.0, None, 0.0, 0.0, FinishedOrderState.CancelledPostOnly
+            return (
+                size * last_close * (1 - taker_fee),
+                last_close,
+                size * last_close,
+                -size * last_close * taker_fee,
+                FinishedOrderState.FilledTaker,
             )
-        else:
-            return FinishedOrder(
-                index=args.index,  # type: ignore
-                order=args.order,  # type: ignore
-                balance_decrement=args.order.size
-                * args.last_close
-                * (1 + args.taker_fee),
-                executed_price=args.last_close,
-                quote_size=args.order.size * args.last_close,
-                fee=abs(args.order.size) * args.last_close * args.taker_fee,
-                state=FinishedOrderState.FilledTaker,
+        if price <= high:
+            return (
+                size * price * (1 - maker_fee),
+                price,
+                size * price,
+                -size * price * maker_fee,
+                FinishedOrderState.FilledMaker,
             )
-    elif limit_order.price >= args.low:
-        return FinishedOrder(
-            index=args.index,  # type: ignore
-            order=args.order,  # type: ignore
-            balance_decrement=args.order.size
-            * limit_order.price
-            * (1 + args.maker_fee),
-            executed_price=limit_order.price,
-            quote_size=args.order.size * limit_order.price,
-            fee=abs(args.order.size) * limit_order.price * args.maker_fee,
-            state=FinishedOrderState.FilledMaker,
+        return 0.0, None, 0.0, 0.0, FinishedOrderState.CancelledNotFilled
+    else:
+        raise ValueError("Order size must be non-zero")
+
+
+def process_orders_vectorized(
+    size: NDArray[np.float64],
+    price: NDArray[np.float64],
+    post_only: NDArray[np.bool_],
+    *,
+    last_close: NDArray[np.float64],
+    high: NDArray[np.float64],
+    low: NDArray[np.float64],
+    maker_fee: float,
+    taker_fee: float,
+) -> tuple[
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.int8],
+]:
+    """Vectorized equivalent of `process_order` for one order per bar.
+
+    A NaN `price` denotes a market order.
+
+    Returns
+    -------
+    tuple[NDArray, NDArray, NDArray, NDArray, NDArray]
+        Balance decrement, executed price (NaN if not filled), quote size,
+        fee and `FinishedOrderState` value of each order.
+    """
+    is_market = np.isnan(price)
+    is_buy = size > 0
+    limit_price = np.where(
+        is_market,
+        np.where(
+            is_buy, last_close * 2, np.where(size < 0, last_close / 2, last_close)
+        ),
+        price,
+    )
+    post_only = post_only & ~is_market
+    is_taker = np.where(is_buy, limit_price >= last_close, limit_price <= last_close)
+    is_maker = ~is_taker & np.where(is_buy, limit_price >= low, limit_price <= high)
+
+    state = np.full(size.shape, FinishedOrderState.CancelledNotFilled.value, np.int8)
+    state[is_taker & post_only] = FinishedOrderState.CancelledPostOnly.value
+    state[is_taker & ~post_only] = FinishedOrderState.FilledTaker.value
+    state[is_maker] = FinishedOrderState.FilledMaker.value
+
+    filled = (state == FinishedOrderState.FilledTaker.value) | is_maker
+    executed_price = np.where(
+        filled, np.where(is_maker, limit_price, last_close), np.nan
+    )
+    fee_rate = np.where(is_maker, maker_fee, taker_fee)
+    quote_size = np.where(filled, size * executed_price, 0.0)
+    fee = np.where(filled, np.abs(size) * executed_price * fee_rate, 0.0)
+    balance_decrement = np.where(
+        filled,
+        quote_size * np.where(is_buy, 1 + fee_rate, 1 - fee_rate),
+        0.0,
+    )
+    return balance_decrement, executed_price, quote_size, fee, state
+
+
+def _process_order_args(
+    args: ProcessOrderArgsBase[_IndexType, _OrderType], *, high: float, low: float
+) -> "FinishedOrder[_IndexType, _OrderType]":
+    """Run the scalar kernel matching the order type and wrap its result."""
+    order = args.order
+    if isinstance(order, LimitOrder):
+        result = process_limit_order_scalar(
+            order.size,
+            order.price,
+            order.post_only,
+            args.last_close,
+            high,
+            low,
+            args.maker_fee,
+            args.taker_fee,
         )
     else:
-        return FinishedOrder(
-            index=args.index,  # type: ignore
-            order=args.order,  # type: ignore
-            balance_decrement=0,
-            executed_price=None,
-            quote_size=0,
-            fee=0,
-            state=FinishedOrderState.CancelledNotFilled,
+        result = process_market_order_scalar(
+            order.size, args.last_close, args.taker_fee
         )
+    balance_decrement, executed_price, quote_size, fee, state = result
+    return FinishedOrder(
+        index=args.index,  # type: ignore
+        order=order,  # type: ignore
+        balance_decrement=balance_decrement,
+        executed_price=executed_price,
+        quote_size=quote_size,
+        fee=fee,
+        state=state,
+    )
+
+
+def process_buy_order(
+    args: ProcessBuyOrderArgs[_IndexType, _OrderType]
+) -> "FinishedOrder[_IndexType, _OrderType]":
+    if args.order.size <= 0:
+        raise ValueError("Buy order size must be positive")
+    # high is not used by buy orders
+    return _process_order_args(args, high=math.nan, low=args.low)
 
 
 def process_sell_order(
@@ -106,53 +252,8 @@ def process_sell_order(
 ) -> "FinishedOrder[_IndexType, _OrderType]":
     if args.order.size >= 0:
         raise ValueError("Sell order size must be negative")
-    limit_order = to_limit_order(args)
-    if limit_order.price <= args.last_close:
-        # taker
-        if limit_order.post_only:
-            return FinishedOrder(
-                index=args.index,  # type: ignore
-                order=args.order,  # type: ignore
-                balance_decrement=0,
-                executed_price=None,
-                quote_size=0,
-                fee=0,
-                state=FinishedOrderState.CancelledPostOnly,
-            )
-        else:
-            return FinishedOrder(
-                index=args.index,  # type: ignore
-                order=args.order,  # type: ignore
-                balance_decrement=args.order.size
-                * args.last_close
-                * (1 - args.taker_fee),
-                executed_price=args.last_close,
-                quote_size=args.order.size * args.last_close,
-                fee=abs(args.order.size) * args.last_close * args.taker_fee,
-                state=FinishedOrderState.FilledTaker,
-            )
-    elif limit_order.price <= args.high:
-        return FinishedOrder(
-            index=args.index,  # type: ignore
-            order=args.order,  # type: ignore
-            balance_decrement=args.order.size
-            * limit_order.price
-            * (1 - args.maker_fee),
-            executed_price=limit_order.price,
-            quote_size=args.order.size * limit_order.price,
-            fee=abs(args.order.size) * limit_order.price * args.maker_fee,
-            state=FinishedOrderState.FilledMaker,
-        )
-    else:
-        return FinishedOrder(
-            index=args.index,  # type: ignore
-            order=args.order,  # type: ignore
-            balance_decrement=0,
-            executed_price=None,
-            quote_size=0,
-            fee=0,
-            state=FinishedOrderState.CancelledNotFilled,
-        )
+    # low is not used by sell orders
+    return _process_order_args(args, high=args.high, low=math.nan)
 
 
 @attrs.frozen(kw_only=True, slots=False)
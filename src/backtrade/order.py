@@ -1,4 +1,3 @@
-from abc import ABCMeta
 from typing import Any, Generic, Hashable, TypeVar, Union
 
 import attrs
@@ -8,30 +7,44 @@ from .validator import _na_validator
 _TOrder = TypeVar("_TOrder", bound="OrderBase[Any]")
 
 
-@attrs.frozen(kw_only=True)
-class OrderBase(Generic[_TOrder], metaclass=ABCMeta):
+@attrs.frozen(kw_only=True, weakref_slot=False)
+class OrderBase(Generic[_TOrder]):
     size: float = attrs.field(validator=_na_validator)
 
+    def _with_size(self: "_TOrder", size: float) -> "_TOrder":
+        return attrs.evolve(self, size=size)
+
     def __mul__(self: "_TOrder", other: float) -> "_TOrder":
-        if not isinstance(other, float):
+        if not isinstance(other, (int, float)):
             return NotImplemented  # type: ignore
         if other < 0:
             raise ValueError(f"Cannot multiply by negative number: {other}")
-        return attrs.evolve(self, size=self.size * other)
+        return self._with_size(self.size * other)
 
-    def __div__(self: "_TOrder", other: float) -> "_TOrder":
-        return self * (1 / other)
+    def __truediv__(self: "_TOrder", other: float) -> "_TOrder":
+        if not isinstance(other, (int, float)):
+            return NotImplemented  # type: ignore
+        if other < 0:
+            raise ValueError(f"Cannot divide by negative number: {other}")
+        return self._with_size(self.size / other)
 
+    __div__ = __truediv__
 
-@attrs.frozen(kw_only=True)
+
+@attrs.frozen(kw_only=True, weakref_slot=False)
 class LimitOrder(OrderBase["LimitOrder"]):
     price: float = attrs.field(validator=_na_validator)
     post_only: bool = attrs.field(validator=_na_validator)
 
+    def _with_size(self, size: float) -> "LimitOrder":
+        # Cheaper than attrs.evolve, which inspects every field
+        return LimitOrder(size=size, price=self.price, post_only=self.post_only)
+
 
-@attrs.frozen(kw_only=True)
+@attrs.frozen(kw_only=True, weakref_slot=False)
 class MarketOrder(OrderBase["MarketOrder"]):
-    pass
+    def _with_size(self, size: float) -> "MarketOrder":
+        return MarketOrder(size=size)
 
 
 _IndexType = TypeVar("_IndexType", bound=Hashable)
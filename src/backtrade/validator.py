@@ -1,9 +1,25 @@
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from attrs import Attribute
+from numpy.typing import NDArray
+
+# Types for which NaN is the only NA value, checked without pd.isna
+_FLOAT_LIKE_TYPES = frozenset({float, int, bool, np.float64, np.bool_})
 
 
 def _na_validator(self: Any, attribute: "Attribute[Any]", value: Any) -> None:
-    if pd.isna(value):
+    if type(value) in _FLOAT_LIKE_TYPES:
+        # NaN is the only value which is not equal to itself
+        is_na = value != value
+    else:
+        is_na = pd.isna(value)
+    if is_na:
         raise ValueError(f"{attribute.name} cannot be {value}")
+
+
+def _na_validator_batch(name: str, values: NDArray[np.float64]) -> None:
+    """`_na_validator` for a whole float column, with one `np.isnan` pass."""
+    if np.isnan(values).any():
+        raise ValueError(f"{name} cannot be {np.nan}")
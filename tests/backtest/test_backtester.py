@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import os
-from random import random
+from functools import lru_cache
 from typing import Any, Iterable
 from unittest import TestCase
 
+import matplotlib
 import matplotlib.style
 import matplotx.styles
 import numpy as np
@@ -14,40 +15,64 @@ from matplotlib import pyplot as plt
 from pandas import DataFrame, Series
 
 from backtrade import Backtester, CloseData, LimitOrder, MarketOrder, _IndexType
+from backtrade.backtest.dtypes import _ProfitStats
 from backtrade.logic import FinishedOrderState
 
+if os.getenv("CI") is not None:
+    # No figure is shown in CI, skip loading a GUI toolkit
+    matplotlib.use("Agg")
 matplotlib.style.use(matplotx.styles.dracula)
 
+_rng = np.random.default_rng()
 
-def generate_random_ohlcv(n: int) -> DataFrame:
-    df = DataFrame({"close": np.random.rand(n + 1)})
+
+@lru_cache(maxsize=None)
+def _random_ohlcv(n: int, seed: int) -> DataFrame:
+    rng = np.random.default_rng(seed)
+    df = DataFrame({"close": rng.random(n + 1)})
     df["open"] = df["close"].shift(1)
     df.dropna(inplace=True)
     assert len(df) == n
-    df["low"] = df[["open", "close"]].min(axis=1) * (1 - np.random.rand(n) * 0.1)
-    df["high"] = df[["open", "close"]].max(axis=1) * (1 + np.random.rand(n) * 0.1)
+    open_ = df["open"].to_numpy()
+    close = df["close"].to_numpy()
+    df["low"] = np.minimum(open_, close) * (1 - rng.random(n) * 0.1)
+    df["high"] = np.maximum(open_, close) * (1 + rng.random(n) * 0.1)
     df.index = pd.date_range("2020-01-01", periods=n, freq="1h")
     return df
 
 
+def generate_random_ohlcv(n: int, seed: int = 0) -> DataFrame:
+    # Generated once per (n, seed), copied since the tests add columns
+    return _random_ohlcv(n, seed).copy()
+
+
 class TestBacktester(TestCase):
+    n: int
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.n = int(np.random.default_rng(0).integers(50, 150))
+
     def setUp(self) -> None:
-        self.n = np.random.randint(50, 150)
-        self.maker_fee = np.random.rand() * 0.01 - 0.005
-        self.taker_fee = np.random.rand() * 0.01
-        self.balance_init = np.random.rand() * 1000
+        self.maker_fee = _rng.random() * 0.01 - 0.005
+        self.taker_fee = _rng.random() * 0.01
+        self.balance_init = _rng.random() * 1000
 
     def test_plot(self):
+        # Decisions of each bar drawn at once
+        decisions = np.random.default_rng(0).random((self.n, 2))
+
         class MyBacktest(Backtester[_IndexType]):
             def init(self):
-                pass
+                self.decisions = iter(decisions)
 
             def on_close(
                 self, close_data: CloseData[_IndexType], row: Series[Any]
             ) -> Iterable[MarketOrder | LimitOrder]:
-                if random() > 0.7:
+                market, limit = next(self.decisions)
+                if market > 0.7:
                     yield MarketOrder(size=1)
-                if random() > 0.5:
+                if limit > 0.5:
                     yield LimitOrder(size=1, price=row["close"] - 0.1, post_only=True)
 
         df = generate_random_ohlcv(self.n)
@@ -93,12 +118,11 @@ class TestBacktester(TestCase):
             taker_fee=self.taker_fee,
             balance_init=self.balance_init,
         )
-        res.plot()
-        istaker = (
-            res.flatten_finished_orders.apply(lambda x: x.state)
-            == FinishedOrderState.FilledTaker
+        # Plotted for coverage only, nothing is shown
+        plt.close(res.plot())
+        self.assertTrue(
+            (res.finished_orders_frame["state"] == FinishedOrderState.FilledTaker).all()
         )
-        self.assertEqual(len(istaker[~istaker]), 0)
         self.assertTrue((res.position == 0).all())
         self.assertAlmostEqual(
             res.equity_quote.iat[-1],
@@ -124,7 +148,8 @@ class TestBacktester(TestCase):
             taker_fee=self.taker_fee,
             balance_init=self.balance_init,
         )
-        res.plot()
+        # Plotted for coverage only, nothing is shown
+        plt.close(res.plot())
         self.assertTrue((res.position == 0).all())
         self.assertTrue((res.equity_quote == self.balance_init).all())
 
@@ -147,9 +172,17 @@ class TestBacktester(TestCase):
             taker_fee=self.taker_fee,
             balance_init=self.balance_init,
         )
-        res.plot()
+        # Plotted for coverage only, nothing is shown
+        plt.close(res.plot())
         self.assertTrue((res.position == 0).all())
         self.assertTrue((res.equity_quote == self.balance_init).all())
+        frame = res.finished_orders_frame
+        self.assertTrue(frame.index.equals(res.finished_orders.index))
+        self.assertTrue(
+            (frame["state"] == FinishedOrderState.CancelledPostOnly.value).all()
+        )
+        self.assertTrue(frame["executed_price"].isna().all())
+        self.assertFalse(frame["filled"].any())
 
     def test_zero_orders(self):
         class MyBacktest(Backtester[_IndexType]):
@@ -170,9 +203,287 @@ class TestBacktester(TestCase):
             taker_fee=self.taker_fee,
             balance_init=self.balance_init,
         )
-        res.plot()
+        # Plotted for coverage only, nothing is shown
+        plt.close(res.plot())
         self.assertTrue((res.position == 0).all())
         self.assertTrue((res.equity_quote == self.balance_init).all())
+        self.assertTrue((res.profit.dropna() == 0).all())
+
+    def test_vectorized(self):
+        class MyBacktest(Backtester[_IndexType]):
+            def on_close(
+                self, close_data: CloseData[_IndexType], row: Series[Any]
+            ) -> Iterable[MarketOrder | LimitOrder]:
+                if row["signal"] > 0.5:
+                    yield LimitOrder(size=1, price=row["close"] - 0.1, post_only=True)
+                else:
+                    yield MarketOrder(size=-1)
+
+            def on_close_vectorized(self, df: DataFrame) -> DataFrame:
+                is_limit = df["signal"] > 0.5
+                return DataFrame(
+                    {
+                        "size": np.where(is_limit, 1, -1),
+                        "price": np.where(is_limit, df["close"] - 0.1, np.nan),
+                        "post_only": is_limit,
+                    },
+                    index=df.index,
+                )
+
+        df = generate_random_ohlcv(self.n)
+        df["signal"] = _rng.random(self.n)
+        bt: Backtester[int] = MyBacktest()
+        kwargs = dict(
+            maker_fee=self.maker_fee,
+            taker_fee=self.taker_fee,
+            balance_init=self.balance_init,
+        )
+        res = bt(df, **kwargs)
+        res_vectorized = bt.vectorized_call(df, **kwargs)
+        for attr in ["position", "position_quote", "balance_quote", "equity_quote"]:
+            np.testing.assert_allclose(
+                getattr(res, attr), getattr(res_vectorized, attr)
+            )
+        self.assertEqual(
+            res.finished_orders_frame["state"].tolist(),
+            res_vectorized.finished_orders_frame["state"].tolist(),
+        )
+        np.testing.assert_allclose(
+            bt(df, vectorized=True, **kwargs).equity_quote,
+            res_vectorized.equity_quote,
+        )
+
+        class NotVectorized(Backtester[_IndexType]):
+            def on_close(
+                self, close_data: CloseData[_IndexType], row: Series[Any]
+            ) -> Iterable[MarketOrder | LimitOrder]:
+                yield from ()
+
+        with self.assertRaisesRegex(NotImplementedError, "NotVectorized"):
+            NotVectorized().vectorized_call(df, **kwargs)
+
+    def test_fast_close_data(self):
+        class MyBacktest(Backtester[_IndexType]):
+            def on_close(
+                self, close_data: CloseData[_IndexType], row: Series[Any]
+            ) -> Iterable[MarketOrder | LimitOrder]:
+                if close_data.position > 0:
+                    yield LimitOrder(
+                        size=-1, price=close_data.close * 1.01, post_only=False
+                    )
+                else:
+                    yield LimitOrder(
+                        size=1, price=close_data.close * 0.99, post_only=False
+                    )
+
+        df = generate_random_ohlcv(self.n)
+        bt: Backtester[int] = MyBacktest()
+        res, res_fast = (
+            bt(
+                df,
+                maker_fee=self.maker_fee,
+                taker_fee=self.taker_fee,
+                balance_init=self.balance_init,
+                fast_close_data=fast_close_data,
+            )
+            for fast_close_data in (False, True)
+        )
+        pd.testing.assert_series_equal(res.equity_quote, res_fast.equity_quote)
+        pd.testing.assert_series_equal(res.position, res_fast.position)
+
+    def test_lazy_row(self):
+        class MyBacktest(Backtester[_IndexType]):
+            def on_close(
+                self, close_data: CloseData[_IndexType], row: Series[Any]
+            ) -> Iterable[MarketOrder | LimitOrder]:
+                assert row.name == close_data.index
+                assert row["close"] == close_data.close
+                assert row[["open", "close"]].tolist() == [
+                    close_data.open,
+                    close_data.close,
+                ]
+                assert "close" in row
+                assert "missing" not in row
+                assert close_data.close not in row
+                assert len(row) == len(df.columns)
+                assert list(row) == df.loc[row.name].tolist()
+                np.testing.assert_array_equal(np.asarray(row), df.loc[row.name])
+                pd.testing.assert_series_equal(row * 2, df.loc[row.name] * 2)
+                assert (row >= 0).all()
+                yield MarketOrder(size=1 if row["close"] > 0.5 else -1)
+
+        df = generate_random_ohlcv(self.n)
+        bt: Backtester[int] = MyBacktest()
+        res, res_lazy = (
+            bt(
+                df,
+                maker_fee=self.maker_fee,
+                taker_fee=self.taker_fee,
+                balance_init=self.balance_init,
+                lazy_row=lazy_row,
+            )
+            for lazy_row in (False, True)
+        )
+        pd.testing.assert_series_equal(res.equity_quote, res_lazy.equity_quote)
+        pd.testing.assert_series_equal(res.position, res_lazy.position)
+
+    def test_scale(self):
+        class MyBacktest(Backtester[_IndexType]):
+            def on_close(
+                self, close_data: CloseData[_IndexType], row: Series[Any]
+            ) -> Iterable[MarketOrder | LimitOrder]:
+                yield MarketOrder(size=1 if close_data.close > 0.5 else -1)
+
+        res = MyBacktest()(
+            generate_random_ohlcv(self.n),
+            maker_fee=self.maker_fee,
+            taker_fee=self.taker_fee,
+            balance_init=self.balance_init,
+        )
+        for scaled in (res * 2, res * 2.0, res * 4 / 2):
+            pd.testing.assert_series_equal(scaled.equity_quote, res.equity_quote * 2)
+            pd.testing.assert_series_equal(scaled.position, res.position * 2)
+            self.assertEqual(
+                [order.order.size for order in scaled.finished_orders],
+                [order.order.size * 2 for order in res.finished_orders],
+            )
+        pd.testing.assert_series_equal((res / 2).equity_quote, res.equity_quote / 2)
+        with self.assertRaises(ValueError):
+            res * -1
+        with self.assertRaises(ValueError):
+            res / -1
+        with self.assertRaises(TypeError):
+            res / "2"  # type: ignore
+
+    def test_profit_stats(self):
+        rng = np.random.default_rng(0)
+        profits = [[0.3] * count for count in range(6)] + [
+            rng.normal(size=count).round(1) for count in range(6)
+        ]
+        for values in profits:
+            profit = pd.Series(values, dtype=float)
+            stats = _ProfitStats.from_profit(profit)
+            np.testing.assert_allclose(
+                [stats.mean, stats.median, stats.std, stats.skew, stats.kurt],
+                [
+                    profit.mean(),
+                    profit.median(),
+                    profit.std(),
+                    profit.skew(),
+                    profit.kurt(),
+                ],
+                err_msg=str(values),
+            )
+
+    def test_n_splits(self):
+        class MyBacktest(Backtester[_IndexType]):
+            def on_close(
+                self, close_data: CloseData[_IndexType], row: Series[Any]
+            ) -> Iterable[MarketOrder | LimitOrder]:
+                yield MarketOrder(size=1 if close_data.close > 0.5 else -1)
+
+        df = generate_random_ohlcv(self.n)
+        split = (self.n + 1) // 2
+        bt: Backtester[int] = MyBacktest()
+        kwargs = dict(
+            maker_fee=self.maker_fee,
+            taker_fee=self.taker_fee,
+            balance_init=self.balance_init,
+            use_tqdm=False,
+        )
+        for logarithmic in [True, False]:
+            with self.subTest(logarithmic=logarithmic):
+                res = bt(df, n_splits=2, logarithmic=logarithmic, **kwargs)
+                first = bt(df.iloc[:split], logarithmic=logarithmic, **kwargs)
+                second = bt(df.iloc[split:], logarithmic=logarithmic, **kwargs)
+
+                # The second split starts where the first one ended
+                self.assertAlmostEqual(
+                    res.equity_quote.iat[split], first.equity_quote.iat[-1]
+                )
+                np.testing.assert_allclose(
+                    res.equity_quote.iloc[:split], first.equity_quote
+                )
+                scale = first.equity_quote.iat[-1] / second.equity_quote.iat[0]
+                if logarithmic:
+                    expected_equity = second.equity_quote * scale
+                    expected_position = second.position * scale
+                else:
+                    expected_equity = second.equity_quote + (
+                        first.equity_quote.iat[-1] - second.equity_quote.iat[0]
+                    )
+                    expected_position = second.position
+                np.testing.assert_allclose(
+                    res.equity_quote.iloc[split:], expected_equity
+                )
+                np.testing.assert_allclose(
+                    res.position,
+                    pd.concat([first.position, expected_position]),
+                )
+                self.assertTrue(res.position.index.equals(df.index))
+                self.assertTrue(
+                    res.finished_orders.index.equals(
+                        first.finished_orders.index.append(second.finished_orders.index)
+                    )
+                )
+
+    def test_sweep(self):
+        class MyBacktest(Backtester[_IndexType]):
+            offset = 0.01
+
+            def on_close(
+                self, close_data: CloseData[_IndexType], row: Series[Any]
+            ) -> Iterable[MarketOrder | LimitOrder]:
+                yield LimitOrder(
+                    size=1, price=close_data.close * (1 - self.offset), post_only=True
+                )
+                yield MarketOrder(size=-close_data.position)
+
+        df = generate_random_ohlcv(self.n)
+        bt: Backtester[int] = MyBacktest()
+        results = bt.sweep(
+            df,
+            {"offset": [0.01, 0.05]},
+            maker_fee=self.maker_fee,
+            taker_fee=self.taker_fee,
+            balance_init=self.balance_init,
+            n_jobs=2,
+        )
+        self.assertEqual(
+            [params for params, _ in results], [{"offset": 0.01}, {"offset": 0.05}]
+        )
+        for params, res in results:
+            bt_single: Backtester[int] = MyBacktest()
+            bt_single.offset = params["offset"]  # type: ignore
+            expected = bt_single(
+                df,
+                maker_fee=self.maker_fee,
+                taker_fee=self.taker_fee,
+                balance_init=self.balance_init,
+            )
+            pd.testing.assert_series_equal(res.equity_quote, expected.equity_quote)
+            self.assertEqual(res.name, f"offset={params['offset']}")
+        self.assertEqual(bt.offset, 0.01)  # type: ignore
+
+        # Keywords of __call__ set by sweep can be overridden
+        results = bt.sweep(
+            df,
+            {"offset": [0.01]},
+            maker_fee=self.maker_fee,
+            taker_fee=self.taker_fee,
+            name="named",
+            use_tqdm=False,
+            n_jobs=1,
+        )
+        self.assertEqual(results[0][1].name, "named")
+        with self.assertRaises(ValueError):
+            bt.sweep(
+                df,
+                {"offset": [0.01]},
+                maker_fee=self.maker_fee,
+                taker_fee=self.taker_fee,
+                n_splits=2,
+            )
 
     def test_errors(self):
         class EmptyBacktest(Backtester[_IndexType]):
@@ -183,13 +494,13 @@ class TestBacktester(TestCase):
 
         df = DataFrame(
             {
-                "Close": np.random.rand(self.n) - 1,
-                "Open": np.random.rand(self.n) - 1,
-                "Low": np.random.rand(self.n) - 1,
-                "High": np.random.rand(self.n) - 1,
+                "Close": _rng.random(self.n) - 1,
+                "Open": _rng.random(self.n) - 1,
+                "Low": _rng.random(self.n) - 1,
+                "High": _rng.random(self.n) - 1,
             }
         )
-        df.index = np.random.randint(0, 10, self.n)
+        df.index = _rng.integers(0, 10, self.n)
         bt: Backtester[int] = EmptyBacktest()
         with self.assertRaises(ExceptionGroup) as ecm:
             with self.assertWarns(UserWarning):
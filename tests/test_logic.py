@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from unittest import TestCase
 
+import numpy as np
+
+from backtrade.finished_order import FinishedOrderArrays
 from backtrade.logic import (
     FinishedOrder,
     FinishedOrderState,
@@ -10,7 +13,10 @@ from backtrade.logic import (
     ProcessSellOrderArgs,
     ToLimitOrderArgs,
     process_buy_order,
+    process_limit_order_scalar,
+    process_market_order_scalar,
     process_order,
+    process_orders_vectorized,
     process_sell_order,
     to_limit_order,
 )
@@ -126,6 +132,66 @@ class TestLogic(TestCase):
             ),
         )
 
+    def test_process_limit_order_scalar(self):
+        for size, price, post_only in [
+            (1, 1.5, False),
+            (1, 1.5, True),
+            (1, 0.8, False),
+            (1, 0.1, False),
+            (-1, 0.5, False),
+            (-1, 0.5, True),
+            (-1, 1.2, False),
+            (-1, 9, False),
+        ]:
+            order = LimitOrder(size=size, price=price, post_only=post_only)
+            finished_order = process_order(
+                ProcessOrderArgs(
+                    order=order,
+                    last_close=1,
+                    high=1.5,
+                    low=0.5,
+                    taker_fee=0.1,
+                    maker_fee=0.01,
+                    index=0,
+                )
+            )
+            self.assertEqual(
+                process_limit_order_scalar(
+                    size, price, post_only, 1, 1.5, 0.5, 0.01, 0.1
+                ),
+                (
+                    finished_order.balance_decrement,
+                    finished_order.executed_price,
+                    finished_order.quote_size,
+                    finished_order.fee,
+                    finished_order.state,
+                ),
+            )
+
+    def test_process_market_order_scalar(self):
+        for size in [1, -1]:
+            finished_order = process_order(
+                ProcessOrderArgs(
+                    order=MarketOrder(size=size),
+                    last_close=1,
+                    high=1.5,
+                    low=0.5,
+                    taker_fee=0.1,
+                    maker_fee=0.01,
+                    index=0,
+                )
+            )
+            self.assertEqual(
+                process_market_order_scalar(size, 1, 0.1),
+                (
+                    finished_order.balance_decrement,
+                    finished_order.executed_price,
+                    finished_order.quote_size,
+                    finished_order.fee,
+                    finished_order.state,
+                ),
+            )
+
     def test_errors(self):
         def create_args(size: int) -> ProcessOrderArgs[int, MarketOrder]:
             return ProcessOrderArgs(
@@ -144,3 +210,123 @@ class TestLogic(TestCase):
             process_sell_order(create_args(1))
         with self.assertRaises(ValueError):
             process_order(create_args(0))
+
+    def test_finished_order_arrays(self):
+        finished_orders = [
+            process_order(
+                ProcessOrderArgs(
+                    order=LimitOrder(size=size, price=price, post_only=True),
+                    last_close=1,
+                    high=1.5,
+                    low=0.5,
+                    taker_fee=0.1,
+                    maker_fee=0.01,
+                    index=index,
+                )
+            )
+            for index, (size, price) in enumerate([(1, 0.8), (-1, 0.8), (1, 0.2)])
+        ]
+        arrays = FinishedOrderArrays.from_orders(
+            [order.index for order in finished_orders], finished_orders
+        )
+        self.assertEqual(len(arrays), 3)
+        self.assertEqual(arrays.index.tolist(), [0, 1, 2])
+        self.assertEqual(
+            arrays.balance_decrement.tolist(),
+            [order.balance_decrement for order in finished_orders],
+        )
+        self.assertEqual(arrays.executed_price[0], finished_orders[0].executed_price)
+        self.assertTrue(np.isnan(arrays.executed_price[1:]).all())
+        self.assertEqual(arrays.fee.tolist(), [order.fee for order in finished_orders])
+        self.assertEqual(
+            arrays.quote_size.tolist(),
+            [order.quote_size for order in finished_orders],
+        )
+        self.assertEqual(
+            arrays.state.tolist(), [order.state.value for order in finished_orders]
+        )
+        self.assertEqual(arrays.filled.tolist(), [True, False, False])
+
+    def test_process_orders_vectorized(self):
+        orders = [
+            order
+            for size in [1, -1]
+            for order in [MarketOrder(size=size)]
+            + [
+                LimitOrder(size=size, price=price, post_only=post_only)
+                for price in [0.2, 0.8, 1, 1.2, 1.8]
+                for post_only in [True, False]
+            ]
+        ]
+        (
+            balance_decrement,
+            executed_price,
+            quote_size,
+            fee,
+            state,
+        ) = process_orders_vectorized(
+            np.array([order.size for order in orders], dtype=np.float64),
+            np.array(
+                [getattr(order, "price", np.nan) for order in orders],
+                dtype=np.float64,
+            ),
+            np.array([getattr(order, "post_only", False) for order in orders]),
+            last_close=np.ones(len(orders)),
+            high=np.full(len(orders), 1.5),
+            low=np.full(len(orders), 0.5),
+            maker_fee=0.01,
+            taker_fee=0.1,
+        )
+        for i, order in enumerate(orders):
+            finished_order = process_order(
+                ProcessOrderArgs(
+                    order=order,
+                    last_close=1,
+                    high=1.5,
+                    low=0.5,
+                    taker_fee=0.1,
+                    maker_fee=0.01,
+                    index=i,
+                )
+            )
+            with self.subTest(order=order):
+                self.assertAlmostEqual(
+                    balance_decrement[i], finished_order.balance_decrement
+                )
+                if finished_order.executed_price is None:
+                    self.assertTrue(np.isnan(executed_price[i]))
+                else:
+                    self.assertEqual(executed_price[i], finished_order.executed_price)
+                self.assertAlmostEqual(quote_size[i], finished_order.quote_size)
+                self.assertAlmostEqual(fee[i], finished_order.fee)
+                self.assertEqual(state[i], finished_order.state.value)
+
+    def test_mul(self):
+        limit_order = LimitOrder(size=2, price=3, post_only=True)
+        self.assertEqual(limit_order * 0.5, LimitOrder(size=1, price=3, post_only=True))
+        self.assertEqual(limit_order / 2, LimitOrder(size=1, price=3, post_only=True))
+        self.assertEqual(MarketOrder(size=-2) * 3, MarketOrder(size=-6))
+        with self.assertRaises(ValueError):
+            limit_order * -1.0
+
+        finished_order = process_order(
+            ProcessOrderArgs(
+                order=limit_order,
+                last_close=1,
+                high=1.5,
+                low=0.5,
+                taker_fee=0.1,
+                maker_fee=0.01,
+                index=0,
+            )
+        )
+        for scaled in [finished_order * 0.5, finished_order / 2]:
+            self.assertEqual(scaled.order, LimitOrder(size=1, price=3, post_only=True))
+            self.assertEqual(scaled.index, finished_order.index)
+            self.assertEqual(scaled.state, finished_order.state)
+            self.assertEqual(scaled.executed_price, finished_order.executed_price)
+            self.assertAlmostEqual(
+                scaled.balance_decrement, finished_order.balance_decrement / 2
+            )
+            self.assertAlmostEqual(scaled.quote_size, finished_order.quote_size / 2)
+            self.assertAlmostEqual(scaled.fee, finished_order.fee / 2)
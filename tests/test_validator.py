@@ -2,8 +2,9 @@ from unittest import TestCase
 
 import attrs
 import numpy as np
+import pandas as pd
 
-from backtrade.validator import _na_validator
+from backtrade.validator import _na_validator, _na_validator_batch
 
 
 class TestNaValidator(TestCase):
@@ -16,3 +17,15 @@ class TestNaValidator(TestCase):
             Test(a=np.nan)
         with self.assertRaises(ValueError):
             Test(a=None)  # type: ignore
+        with self.assertRaises(ValueError):
+            Test(a=np.float64("nan"))  # type: ignore
+        with self.assertRaises(ValueError):
+            Test(a=pd.NA)  # type: ignore
+        for a in [0, 1.5, np.float64(-1), True, np.bool_(False)]:
+            Test(a=a)  # type: ignore
+
+    def test_na_validator_batch(self):
+        _na_validator_batch("a", np.array([0.0, 1.5, -1.0]))
+        _na_validator_batch("a", np.array([]))
+        with self.assertRaises(ValueError):
+            _na_validator_batch("a", np.array([0.0, np.nan]))